@@ -4,9 +4,9 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 import time
 import random
+import requests
+from lxml import html as lxml_html
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
-from utils import wait_for_element
-from driver_setup import random_delay
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 logger = logging.getLogger(__name__)
@@ -28,13 +28,93 @@ class NavigationException(Exception):
     """Raised when navigation fails"""
     pass
 
+ASSIGNMENTS_URL = "https://www.lbridge.com/Interpreters/open_assignments.aspx"
+
+# Locators built once at import instead of on every call (and every tenacity re-entry)
+_NO_DATA_XPATH = (By.XPATH,
+    "//*[contains(text(), 'No assignments') or contains(text(), 'No records') or contains(text(), 'No data')]")
+_TABLE_CSS = (By.CSS_SELECTOR, 'table, [id*="gvOrders"], table[role="grid"]')
+_TABLE_XPATH = (By.XPATH,
+    "//table[contains(@id, 'gvOrders') or contains(@class, 'grid')]"
+    " | //div[contains(@class, 'gridview')]//table")
+
+# Session/error/timeout probes fused into one script: a single round trip
+# instead of three back-to-back find_elements calls
+_SESSION_PROBE_JS = """
+    return {
+        login: !!document.querySelector('input[type="password"], #login, .login-form'),
+        error: (document.querySelector('.error-message, .alert-error') || {}).innerText || '',
+        sessionTimeout: /session[\\s\\S]*expired/i.test(document.body ? document.body.innerText : '')
+    };
+"""
+
+def _build_assignment(cells) -> dict:
+    """Normalize one row of raw cell text into an assignment dictionary"""
+    customer, date_time, language, service_type, info, comments = (c.strip() for c in cells[:6])
+    return {
+        'customer': customer.lower(),  # Normalize customer name to lowercase
+        'date_time': ' '.join(date_time.split()),  # Replace newlines with space
+        'language': language,  # Keep language case as-is
+        'service_type': service_type.lower(),  # Normalize service type to lowercase
+        'info': info,  # Keep info case as-is for readability
+        'comments': comments,  # Keep comments case as-is for readability
+    }
+
+def _fetch_assignments_http(driver):
+    """
+    Fetch the assignments page over plain HTTP using the browser's session cookies
+
+    The page is a static GridView once logged in, so a direct GET plus lxml
+    parsing skips all browser-side rendering and row iteration.
+
+    Returns:
+        list: Assignment dictionaries, or None if the fast path is unusable
+              (redirected to login, unexpected status, no recognizable table)
+    """
+    try:
+        session = requests.Session()
+        for cookie in driver.get_cookies():
+            session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'))
+
+        user_agent = driver.execute_script("return navigator.userAgent")
+        response = session.get(ASSIGNMENTS_URL, headers={'User-Agent': user_agent}, timeout=15)
+
+        if response.status_code != 200 or 'login' in response.url.lower():
+            logger.info(f"HTTP fast path unusable (status {response.status_code}, url {response.url})")
+            return None
+
+        doc = lxml_html.fromstring(response.content)
+        rows = doc.xpath('//table[contains(@id, "gvOrders")]//tr[td]')
+        if not rows:
+            logger.info("HTTP fast path found no assignment table rows")
+            return None
+
+        assignments = []
+        for row in rows:
+            # text_content() drops the line break a <br> renders as (the
+            # date cell is '01/25/2025<br>07:30 PM'), which would glue the
+            # components together; joining itertext() chunks with a newline
+            # matches what innerText gives the browser path
+            cells = ['\n'.join(td.itertext()) for td in row.findall('td')]
+            if len(cells) >= 6:
+                assignments.append(_build_assignment(cells))
+
+        logger.info(f"HTTP fast path extracted {len(assignments)} assignments")
+        return assignments
+
+    except Exception as e:
+        logger.warning(f"HTTP fast path failed, falling back to browser: {str(e)}")
+        return None
+
 @retry(
     stop=stop_after_attempt(5),  # Increase retry attempts
     wait=wait_exponential(multiplier=1, min=4, max=30),  # Longer max wait time
     retry=retry_if_exception_type((
+        # Only transient failures are worth retrying; an expired session or
+        # maintenance page will not fix itself within the backoff window
         TimeoutException,
         NoSuchElementException,
-        Exception  # Catch all for network issues
+        NavigationException
     )),
     before_sleep=lambda retry_state: logger.warning(
         f"Retry attempt {retry_state.attempt_number} after error: {retry_state.outcome.exception()}"
@@ -51,29 +131,37 @@ def get_assignments(driver) -> list:
         Exception: If unable to retrieve assignments after all retries
     """
     try:
+        # Fast path: fetch and parse the page without the browser when the
+        # session cookies are enough; fall through to Selenium otherwise
+        assignments = _fetch_assignments_http(driver)
+        if assignments is not None:
+            return assignments
+
+        # One wait object per timeout, reused across all conditions below.
+        # The predicates are cheap (readyState, rows.length), so poll at
+        # 100ms instead of Selenium's 500ms default to cut latent gap
+        wait10 = WebDriverWait(driver, 10, poll_frequency=0.1)
+        wait20 = WebDriverWait(driver, 20, poll_frequency=0.1)
+
         logger.info("Navigating to assignments page...")
-        driver.get("https://www.lbridge.com/Interpreters/open_assignments.aspx")
-        
-        # Wait for page load
-        WebDriverWait(driver, 10).until(
-            lambda d: d.execute_script('return document.readyState') == 'complete'
-        )
+        driver.get(ASSIGNMENTS_URL)
         
+        # Wait for page load (single round trip when the page is already loaded)
+        driver.wait_for_load(timeout=10)
+
         # Enhanced session validation
         try:
-            # Check for multiple indicators of session state
-            login_elements = driver.find_elements(By.CSS_SELECTOR, 'input[type="password"], #login, .login-form')
-            error_elements = driver.find_elements(By.CSS_SELECTOR, '.error-message, .alert-error')
-            session_timeout_elements = driver.find_elements(By.XPATH, "//*[contains(text(), 'session') and contains(text(), 'expired')]")
-            
-            if login_elements:
+            # Check all indicators of session state in one round trip
+            state = driver.execute_script(_SESSION_PROBE_JS)
+
+            if state['login']:
                 logger.error("Found login elements - session expired")
                 raise SessionExpiredException("Session expired - login elements found")
-            elif error_elements:
-                error_text = error_elements[0].text if error_elements else "Unknown error"
+            elif state['error']:
+                error_text = state['error'].strip() or "Unknown error"
                 logger.error(f"Found error message: {error_text}")
                 raise WebsiteErrorException(f"Website error: {error_text}")
-            elif session_timeout_elements:
+            elif state['sessionTimeout']:
                 logger.error("Session timeout detected")
                 raise SessionExpiredException("Session timeout message found")
                 
@@ -87,42 +175,35 @@ def get_assignments(driver) -> list:
         # Enhanced URL validation with health check
         current_url = driver.current_url
         logger.info(f"Current URL after navigation: {current_url}")
-        
-        # Define valid URLs and redirects
-        VALID_URLS = [
-            "lbridge.com/Interpreters/open_assignments",
-            "www.lbridge.com/Interpreters/open_assignments"
-        ]
-        ERROR_INDICATORS = ["error", "maintenance", "unavailable", "login"]
-        
+
+        # Lowercase once; both accepted URL forms reduce to the same
+        # open_assignments path segment
+        url_lower = current_url.lower()
+
         # Check if we're on a valid page
-        if any(valid_url in current_url.lower() for valid_url in VALID_URLS):
+        if "open_assignments" in url_lower:
             logger.info("Successfully validated current URL")
         else:
             # Check for known error states
-            if any(indicator in current_url.lower() for indicator in ERROR_INDICATORS):
-                if "login" in current_url.lower():
-                    logger.error("Redirected to login page")
-                    raise SessionExpiredException("Session expired - redirected to login")
-                elif "maintenance" in current_url.lower():
-                    logger.error("Site is in maintenance mode")
-                    raise MaintenanceModeException("Site is under maintenance")
-                elif "error" in current_url.lower() or "unavailable" in current_url.lower():
-                    logger.error("Site error page detected")
-                    raise WebsiteErrorException("Site error page encountered")
-            
+            if "login" in url_lower:
+                logger.error("Redirected to login page")
+                raise SessionExpiredException("Session expired - redirected to login")
+            elif "maintenance" in url_lower:
+                logger.error("Site is in maintenance mode")
+                raise MaintenanceModeException("Site is under maintenance")
+            elif "error" in url_lower or "unavailable" in url_lower:
+                logger.error("Site error page detected")
+                raise WebsiteErrorException("Site error page encountered")
+
             # If not on a valid page or known error page, try to recover
             logger.warning(f"Not on assignments page. Current URL: {current_url}")
             recovery_attempts = 3
             for attempt in range(recovery_attempts):
                 try:
                     logger.info(f"Recovery attempt {attempt + 1}/{recovery_attempts}")
-                    driver.get("https://www.lbridge.com/Interpreters/open_assignments.aspx")
-                    WebDriverWait(driver, 10).until(
-                        lambda d: d.execute_script('return document.readyState') == 'complete'
-                    )
-                    current_url = driver.current_url
-                    if any(valid_url in current_url.lower() for valid_url in VALID_URLS):
+                    driver.get(ASSIGNMENTS_URL)
+                    driver.wait_for_load(timeout=10)
+                    if "open_assignments" in driver.current_url.lower():
                         logger.info("Successfully recovered navigation")
                         break
                 except Exception as e:
@@ -132,7 +213,7 @@ def get_assignments(driver) -> list:
         
         # Add intelligent delay based on page load time
         start_time = time.time()
-        WebDriverWait(driver, 20).until(
+        wait20.until(
             lambda d: d.execute_script('return document.readyState') == 'complete' and
                      len(d.find_elements(By.TAG_NAME, 'table')) > 0
         )
@@ -149,112 +230,102 @@ def get_assignments(driver) -> list:
         # Try to find the table directly with a more flexible approach
         table = None
         try:
-            # First try: Wait for any table to be present
-            table = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, 'table'))
-            )
+            # The combined wait above already confirmed a table is present,
+            # so grab it directly rather than paying another wait cycle
+            table = driver.find_element(By.TAG_NAME, 'table')
             logger.info("Found table using generic table tag")
-            logger.info(f"Table HTML: {table.get_attribute('outerHTML')[:500]}")
-        except TimeoutException:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Table HTML: {table.get_attribute('outerHTML')[:500]}")
+        except NoSuchElementException:
             logger.info("Could not find table using generic tag, trying specific locators")
-            
-            # Try different possible locators for the assignments table
-            table_locators = [
-                (By.ID, 'gvOrders'),
-                (By.CSS_SELECTOR, '[id*="gvOrders"]'),
-                (By.CSS_SELECTOR, 'table[role="grid"]'),
-                (By.XPATH, "//table[contains(@id, 'gvOrders')]"),
-                (By.XPATH, "//table[contains(@class, 'grid')]"),
-                (By.XPATH, "//div[contains(@class, 'gridview')]//table")
-            ]
-            
-            for selector_type, selector_value in table_locators:
+
+            # Poll all CSS-compatible locators in one compound selector instead of
+            # six sequential 5s waits (worst case 30s of sequential polling)
+            try:
+                table = wait10.until(
+                    EC.presence_of_element_located(_TABLE_CSS)
+                )
+            except TimeoutException:
+                # Last resort: the structural variants only XPath can express
                 try:
-                    logger.info(f"Attempting to find table with locator: {selector_type}={selector_value}")
-                    table = WebDriverWait(driver, 5).until(
-                        EC.presence_of_element_located((selector_type, selector_value))
+                    table = wait10.until(
+                        EC.presence_of_element_located(_TABLE_XPATH)
                     )
-                    if table:
-                        logger.info(f"Found table with {selector_value}")
-                        logger.info(f"Table HTML: {table.get_attribute('outerHTML')[:500]}")
-                        random_delay()  # Add delay after finding table
-                        break
                 except TimeoutException:
-                    continue
+                    table = None
+
+            if table is not None:
+                logger.info("Found table using fallback locators")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Table HTML: {table.get_attribute('outerHTML')[:500]}")
         
         if not table:
             logger.error("Could not find assignments table with any of the locators")
             return []
             
-        # Check for "no assignments" or empty table indicators
-        try:
-            no_data_messages = driver.find_elements(By.XPATH, 
-                "//*[contains(text(), 'No assignments') or contains(text(), 'No records') or contains(text(), 'No data')]")
+        # Check for "no assignments" or empty table indicators. The no-data
+        # XPath walks every text node in the DOM, so only probe it when the
+        # table itself looks empty (no rows, or headers only)
+        row_count = driver.execute_script("return arguments[0].rows.length", table)
+        if row_count <= 1:
+            no_data_messages = driver.find_elements(*_NO_DATA_XPATH)
             if no_data_messages:
                 logger.info("Found 'no assignments' message: " + no_data_messages[0].text)
                 return []
-                
-            # Also check if the table is empty or only contains headers
-            table_text = table.text.strip()
-            if not table_text:
+            if row_count == 0:
                 logger.info("Table is empty")
                 return []
-            logger.info(f"Table text preview: {table_text[:200]}")
-        except Exception as e:
-            logger.error(f"Error checking for empty table: {str(e)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Table text preview: {table.text.strip()[:200]}")
         
         assignments = []
         try:
-            # Wait for table to be fully loaded
-            WebDriverWait(driver, 10).until(
-                lambda d: len(table.find_elements(By.TAG_NAME, 'tr')) > 0
+            # Wait for table to be fully loaded; HTMLTableElement.rows is O(1)
+            # and the predicate returns a plain bool rather than a node list
+            wait10.until(
+                lambda d: d.execute_script("return arguments[0].rows.length > 0", table)
             )
-            
-            # Get all rows including their HTML for debugging
-            all_rows = table.find_elements(By.TAG_NAME, 'tr')
-            logger.info(f"Found {len(all_rows)} total rows")
-            for i, row in enumerate(all_rows[:2]):  # Log first two rows for debugging
-                logger.info(f"Row {i} HTML: {row.get_attribute('outerHTML')}")
-            
-            # Filter out header rows by checking cell type (th vs td)
-            rows = []
-            for row in all_rows:
-                th_cells = row.find_elements(By.TAG_NAME, 'th')
-                td_cells = row.find_elements(By.TAG_NAME, 'td')
-                if len(td_cells) > 0 and len(th_cells) == 0:  # Only include rows with td cells
-                    rows.append(row)
-            
-            logger.info(f"Found {len(rows)} data rows after filtering headers")
-            
-            for row in rows:
+
+            # The HTML preview is logging only; extraction always goes
+            # through the same script so DEBUG runs scrape identical data
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Table HTML: {table.get_attribute('outerHTML')[:500]}")
+
+            # Extract all cell text in a single script execution instead of
+            # issuing one WebDriver round trip per row and per cell
+            raw_rows = driver.execute_script(
+                """
+                const out = [];
+                for (const tr of arguments[0].querySelectorAll('tr:has(td):not(:has(th))')) {
+                    const tds = tr.getElementsByTagName('td');
+                    if (tds.length >= 6) {
+                        out.push([tds[0].innerText, tds[1].innerText, tds[2].innerText,
+                                  tds[3].innerText, tds[4].innerText, tds[5].innerText]);
+                    }
+                }
+                return out;
+                """,
+                table
+            )
+            logger.info(f"Found {len(raw_rows)} data rows")
+
+            for cells in raw_rows:
                 try:
-                    # No need for delay between rows as we're just reading data
-                    cells = row.find_elements(By.TAG_NAME, 'td')
-                    if len(cells) >= 6:
-                        # Clean and format date_time
-                        date_time = ' '.join(cells[1].text.strip().split())  # Replace newlines with space
-                        
-                        # Normalize core fields during initial parsing
-                        assignment = {
-                            'customer': cells[0].text.strip().lower(),  # Normalize customer name to lowercase
-                            'date_time': date_time,  # Already normalized above
-                            'language': cells[2].text.strip(),  # Keep language case as-is
-                            'service_type': cells[3].text.strip().lower(),  # Normalize service type to lowercase
-                            'info': cells[4].text.strip(),  # Keep info case as-is for readability
-                            'comments': cells[5].text.strip(),  # Keep comments case as-is for readability
-                        }
-                        assignments.append(assignment)
+                    assignments.append(_build_assignment(cells))
                 except Exception as e:
                     logger.error(f"Error processing row: {str(e)}. Skipping to next row.")
                     continue
-            
+
             logger.info(f"Found {len(assignments)} assignments")
             return assignments
             
         except NoSuchElementException:
             logger.error("Could not find table rows in the assignments table")
             logger.error(f"Current URL: {driver.current_url}")
-            logger.error(f"Page source preview: {driver.page_source[:500]}")
+            # Slice in the browser so only 500 chars cross the wire,
+            # not the whole serialized page
+            logger.error("Page source preview: " + driver.execute_script(
+                "return document.documentElement.outerHTML.substring(0, 500)"))
             return []
             
     except Exception as e:
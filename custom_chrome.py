@@ -1,33 +1,38 @@
 import undetected_chromedriver as uc
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Stealth patches (webdriver flag, window.chrome, permissions query) combined
+# into one pre-built IIFE so Chrome parses a single compact script per
+# navigation instead of a multiline commented source built per instance
+_STEALTH_JS = (
+    "(function(){"
+    "Object.defineProperty(navigator,'webdriver',{get:()=>undefined});"
+    "window.chrome={runtime:{}};"
+    "const q=window.navigator.permissions.query;"
+    "window.navigator.permissions.query=(p)=>("
+    "p.name==='notifications'?Promise.resolve({state:Notification.permission}):q(p));"
+    "})();"
+)
 
 class CustomChrome(uc.Chrome):
     """Custom Chrome driver that suppresses the __del__ method and adds additional stealth features"""
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        
+
         # Add additional stealth configurations
-        self.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-            "source": """
-                // Pass the Webdriver Test.
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                
-                // Pass the Chrome Test.
-                window.chrome = {
-                    runtime: {}
-                };
-                
-                // Pass the Permissions Test.
-                const originalQuery = window.navigator.permissions.query;
-                window.navigator.permissions.query = (parameters) => (
-                    parameters.name === 'notifications' ?
-                        Promise.resolve({ state: Notification.permission }) :
-                        originalQuery(parameters)
-                );
-            """
-        })
+        self.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _STEALTH_JS})
     
+    def wait_for_load(self, timeout=10):
+        """Wait for the current document's load event to have fired.
+
+        Checks performance.timing.loadEventEnd once, so a page that is
+        already loaded costs a single round trip instead of a polling loop.
+        """
+        is_loaded = lambda d: d.execute_script("return performance.timing.loadEventEnd > 0")
+        if is_loaded(self):
+            return
+        WebDriverWait(self, timeout).until(is_loaded)
+
     def __del__(self):
         """Override the destructor to prevent invalid handle errors"""
         try:
@@ -0,0 +1,44 @@
+import os
+import logging
+import queue
+from contextlib import contextmanager
+from driver_setup import setup_driver
+
+logger = logging.getLogger(__name__)
+
+class DriverPool:
+    """Pool of warm Chrome drivers for parallel scraping
+
+    Keeps up to `size` drivers alive between runs so each worker skips the
+    ~10s Chrome cold start. Selenium calls release the GIL during driver IO,
+    so running workers in a ThreadPoolExecutor over acquire() scales with
+    the pool size.
+    """
+
+    def __init__(self, size: int = None):
+        self.size = size if size is not None else int(os.getenv('SCRAPER_PARALLELISM', '2'))
+        self._queue = queue.Queue()
+        for _ in range(self.size):
+            self._queue.put(setup_driver())
+        logger.info(f"Driver pool initialized with {self.size} drivers")
+
+    @contextmanager
+    def acquire(self, timeout: float = None):
+        """Check a driver out of the pool for the duration of a with block"""
+        driver = self._queue.get(timeout=timeout)
+        try:
+            yield driver
+        finally:
+            self._queue.put(driver)
+
+    def close(self):
+        """Quit every pooled driver"""
+        while True:
+            try:
+                driver = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.error(f"Error quitting pooled driver: {str(e)}")
@@ -1,27 +1,62 @@
 import os
+import json
 import logging
 import random
 import platform
+import shutil
 import subprocess
 import time
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from custom_chrome import CustomChrome
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 logger = logging.getLogger(__name__)
 
-# List of common user agents
-USER_AGENTS = [
+# Immutable tuple of common user agents (safe to share across forked workers)
+USER_AGENTS = (
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.159 Safari/537.36',
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.159 Safari/537.36',
     'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-]
+)
 
+# Dedicated RNG instance: avoids the global random module's lock when
+# setup_driver runs from multiple threads
+_RNG = random.Random()
+
+# Chrome version effectively never changes within a day, so cache the
+# detection result on disk (and in-process) instead of spawning a
+# subprocess / reading the registry on every setup_driver retry
+_VERSION_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "bridgescrap", "chrome_version.json")
+_VERSION_CACHE_TTL = 86400  # 24 hours
+
+@functools.lru_cache(maxsize=1)
 def get_chrome_version():
-    """Get the installed Chrome version based on the platform"""
+    """Get the installed Chrome version, using a cached value when fresh"""
+    try:
+        with open(_VERSION_CACHE_FILE, 'r') as f:
+            cached = json.load(f)
+        if time.time() - cached['ts'] < _VERSION_CACHE_TTL:
+            logger.info(f"Using cached Chrome version: {cached['version']}")
+            return cached['version']
+    except Exception:
+        pass  # Missing or unreadable cache just means we detect again
+
+    version = _detect_chrome_version()
+
+    try:
+        os.makedirs(os.path.dirname(_VERSION_CACHE_FILE), exist_ok=True)
+        with open(_VERSION_CACHE_FILE, 'w') as f:
+            json.dump({'version': version, 'ts': time.time()}, f)
+    except Exception as e:
+        logger.warning(f"Could not write Chrome version cache: {str(e)}")
+
+    return version
+
+def _detect_chrome_version():
+    """Detect the installed Chrome version based on the platform"""
     try:
         system = platform.system().lower()
         version = None
@@ -34,24 +69,39 @@ def get_chrome_version():
                 ['google-chrome-stable', '--version']
             ]
             
-            for cmd in commands:
-                try:
-                    output = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-                    version_str = output.decode().strip().split()[-1]
-                    logger.info(f"Detected Chrome version string: {version_str}")
-                    
-                    # Extract major version
-                    major_version = version_str.split('.')[0]
-                    try:
-                        version = int(major_version)
-                        logger.info(f"Successfully parsed major version: {version}")
-                        break
-                    except ValueError:
-                        logger.warning(f"Could not parse major version from: {major_version}")
-                        continue
-                except (subprocess.CalledProcessError, IndexError) as e:
-                    logger.warning(f"Failed to get version using {cmd}: {str(e)}")
-                    continue
+            # Skip binaries that aren't installed instead of paying a
+            # failed fork/exec to find out, then probe the rest
+            # concurrently - fork/exec/read release the GIL, so the first
+            # success wins instead of waiting out failures one by one
+            available = [cmd for cmd in commands if shutil.which(cmd[0])]
+            if available:
+                with ThreadPoolExecutor(max_workers=len(available)) as executor:
+                    futures = {
+                        executor.submit(subprocess.run, cmd, capture_output=True,
+                                        text=True, timeout=2): cmd
+                        for cmd in available
+                    }
+                    for future in as_completed(futures):
+                        cmd = futures[future]
+                        try:
+                            result = future.result()
+                            if result.returncode != 0:
+                                continue
+                            version_str = result.stdout.strip().split()[-1]
+                            logger.info(f"Detected Chrome version string: {version_str}")
+
+                            # Extract major version
+                            major_version = version_str.split('.')[0]
+                            try:
+                                version = int(major_version)
+                                logger.info(f"Successfully parsed major version: {version}")
+                                break
+                            except ValueError:
+                                logger.warning(f"Could not parse major version from: {major_version}")
+                                continue
+                        except (subprocess.SubprocessError, IndexError) as e:
+                            logger.warning(f"Failed to get version using {cmd}: {str(e)}")
+                            continue
                     
         elif system == "darwin":
             try:
@@ -79,27 +129,61 @@ def get_chrome_version():
         return version
             
     except Exception as e:
-        logger.error(f"Error in get_chrome_version: {str(e)}")
+        logger.error(f"Error in _detect_chrome_version: {str(e)}")
         logger.info("Falling back to default Chrome version: 108")
         return 108
 
-def random_delay():
-    """Add a random delay between operations"""
-    delay = random.uniform(2, 5)
-    logger.info(f"Adding random delay of {delay:.2f} seconds")
-    time.sleep(delay)
-    return delay
+# Chromedriver paths resolved by webdriver-manager, persisted per Chrome
+# major version so later runs skip its version-check HTTP call while the
+# binary is still on disk (same pattern as the Chrome version cache above)
+_DRIVER_PATH_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "bridgescrap", "chromedriver_path.json")
+
+@functools.lru_cache(maxsize=4)
+def _resolve_driver_path(chrome_version):
+    """Resolve the chromedriver binary for a Chrome major version
+
+    Returns the path webdriver-manager installed on a previous run when
+    that binary still exists, so setup_driver retries and fresh processes
+    never repeat the version-check HTTP call for a driver that is already
+    on disk.
+    """
+    try:
+        with open(_DRIVER_PATH_CACHE_FILE, 'r') as f:
+            cached = json.load(f)
+        path = cached.get(str(chrome_version))
+        if path and os.path.exists(path):
+            logger.info(f"Using cached chromedriver at {path}")
+            return path
+    except Exception:
+        cached = {}  # Missing or unreadable cache just means we resolve again
+
+    # Deferred import: webdriver_manager drags in requests/urllib3/certifi,
+    # which short-lived invocations that never launch Chrome shouldn't pay for
+    from webdriver_manager.chrome import ChromeDriverManager
+    path = ChromeDriverManager().install()
+
+    try:
+        os.makedirs(os.path.dirname(_DRIVER_PATH_CACHE_FILE), exist_ok=True)
+        cached[str(chrome_version)] = path
+        with open(_DRIVER_PATH_CACHE_FILE, 'w') as f:
+            json.dump(cached, f)
+    except Exception as e:
+        logger.warning(f"Could not write chromedriver path cache: {str(e)}")
+
+    return path
 
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
 def setup_driver():
     """Set up and configure the Chrome WebDriver with anti-detection measures"""
+    from custom_chrome import CustomChrome  # deferred: pulls in undetected_chromedriver
+
     try:
         # Random window size
-        width = random.randint(1800, 1920)
-        height = random.randint(1000, 1080)
+        width = _RNG.randint(1800, 1920)
+        height = _RNG.randint(1000, 1080)
         
         # Random user agent
-        user_agent = random.choice(USER_AGENTS)
+        user_agent = _RNG.choice(USER_AGENTS)
         logger.info(f"Using user agent: {user_agent}")
         logger.info(f"Using window size: {width}x{height}")
         
@@ -122,37 +206,24 @@ def setup_driver():
         
         # Initialize the driver with detected version
         driver = CustomChrome(
-            driver_executable_path=ChromeDriverManager().install(),
+            driver_executable_path=_resolve_driver_path(chrome_version),
             options=options,
             version_main=chrome_version,
             headless=True if os.getenv('GITHUB_ACTIONS') else False,
             use_subprocess=True
         )
         
-        driver.implicitly_wait(10)
+        # No implicit wait: every lookup in this codebase goes through
+        # WebDriverWait/wait_for_element with its own timeout, and mixing
+        # implicit and explicit waits makes each explicit wait pay up to
+        # the sum of both
+        driver.implicitly_wait(0)
         
-        # Execute CDP commands to prevent detection
+        # Execute CDP commands to prevent detection. CustomChrome.__init__
+        # already registers the stealth script (_STEALTH_JS) once, so only
+        # the user-agent override is needed here - re-registering the same
+        # source would make Chrome parse it twice on every navigation
         driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": user_agent})
-        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-            "source": """
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                
-                // Pass the Chrome Test
-                window.chrome = {
-                    runtime: {}
-                };
-                
-                // Pass the Permissions Test
-                const originalQuery = window.navigator.permissions.query;
-                window.navigator.permissions.query = (parameters) => (
-                    parameters.name === 'notifications' ?
-                        Promise.resolve({ state: Notification.permission }) :
-                        originalQuery(parameters)
-                );
-            """
-        })
         
         logger.info("WebDriver setup completed successfully")
         return driver
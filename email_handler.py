@@ -1,13 +1,82 @@
 import os
+import atexit
 import logging
 import smtplib
+import socket
+import threading
+from email import policy
 from email.mime.text import MIMEText
 from datetime import datetime
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, stop_after_attempt, wait_exponential_jitter, retry_if_exception_type
 
 logger = logging.getLogger(__name__)
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
+# Reusable SMTP connection: connect/TLS/login costs ~0.5-2s per message,
+# so keep one authenticated connection alive for the process lifetime
+_smtp_lock = threading.Lock()
+_smtp_conn = None
+
+def _get_smtp(email_user, email_password):
+    """Return a live, authenticated SMTP connection, reconnecting only when
+    the pooled one no longer answers a NOOP. Caller must hold _smtp_lock."""
+    global _smtp_conn
+    if _smtp_conn is not None:
+        try:
+            status, _ = _smtp_conn.noop()
+            if status == 250:
+                return _smtp_conn
+        except Exception:
+            pass
+        _close_smtp()
+
+    conn = smtplib.SMTP('smtp.gmail.com', 587, timeout=int(os.getenv('SMTP_TIMEOUT', '30')))
+    conn.starttls()
+    conn.login(email_user, email_password)
+    _smtp_conn = conn
+    return conn
+
+def _close_smtp():
+    """Quit and drop the pooled SMTP connection, ignoring teardown errors"""
+    global _smtp_conn
+    if _smtp_conn is not None:
+        try:
+            _smtp_conn.quit()
+        except Exception:
+            pass
+        _smtp_conn = None
+
+atexit.register(_close_smtp)
+
+# Fields in a specific order for consistency; only customer and
+# service_type get re-cased for readability, the rest pass through
+# unchanged (unbound str.title avoids allocating per-field lambdas)
+_FIELD_ORDER = ('customer', 'date_time', 'language', 'service_type', 'info', 'comments')
+_FIELD_FORMATTERS = {'customer': str.title, 'service_type': str.title}
+_FIELD_TITLES = {field: field.title() for field in _FIELD_ORDER}
+
+# Only transient transport failures are worth retrying; auth errors
+# won't fix themselves and repeated attempts risk account lockout
+_TRANSIENT_SMTP_ERRORS = (
+    smtplib.SMTPServerDisconnected,
+    smtplib.SMTPConnectError,
+    socket.timeout
+)
+
+def _smtp_retry_failed(retry_state):
+    """Preserve send_notification's bool contract once retries are exhausted"""
+    logger.error(
+        f"Failed to send email notification after {retry_state.attempt_number} "
+        f"attempts: {retry_state.outcome.exception()}"
+    )
+    return False
+
+@retry(
+    stop=stop_after_attempt(3),
+    # Jitter keeps parallel CI runners from synchronising their reconnects
+    wait=wait_exponential_jitter(initial=4, max=30, jitter=2),
+    retry=retry_if_exception_type(_TRANSIENT_SMTP_ERRORS),
+    retry_error_callback=_smtp_retry_failed
+)
 def send_notification(changes, assignments):
     """Send email notification with retry logic"""
     if not changes:
@@ -25,48 +94,47 @@ def send_notification(changes, assignments):
     try:
         subject = f"Bridge Assignments Changes Detected - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
 
-        body = "The following changes were detected:\n\n"
-        for change in changes:
-            body += f"{change}\n"
-        
-        body += "\n\nCurrent Assignments:\n"
+        # Collect fragments and join once instead of growing a string in place
+        parts = ["The following changes were detected:\n"]
+        parts.extend(f"{change}" for change in changes)
+
+        parts.append("\n\nCurrent Assignments:")
         for i, assignment in enumerate(assignments, 1):
-            body += f"\nAssignment #{i}:\n"
-            # Format fields consistently for display
-            display_fields = {
-                'customer': lambda x: x.title(),  # Title case for readability
-                'date_time': lambda x: x,  # Keep standardized format
-                'language': lambda x: x,  # Keep original case
-                'service_type': lambda x: x.title(),  # Title case for readability
-                'info': lambda x: x,  # Keep original formatting
-                'comments': lambda x: x  # Keep original formatting
-            }
-            
-            # Add fields in a specific order for consistency
-            field_order = ['customer', 'date_time', 'language', 'service_type', 'info', 'comments']
-            for key in field_order:
+            parts.append(f"\nAssignment #{i}:")
+            for key in _FIELD_ORDER:
                 value = assignment.get(key)
                 if value and value != 'N/A':  # Only include non-empty and non-N/A values
-                    formatter = display_fields.get(key, lambda x: x)
-                    body += f"{key.title()}: {formatter(value)}\n"
-            body += "\n"
+                    formatter = _FIELD_FORMATTERS.get(key)
+                    parts.append(f"{_FIELD_TITLES[key]}: {formatter(value) if formatter else value}")
+            parts.append("")
 
-        msg = MIMEText(body)
+        # utf-8 up front: the default us-ascii charset re-encodes the body
+        # on send and mangles non-ASCII customer names
+        msg = MIMEText("\n".join(parts), _charset='utf-8')
         msg['Subject'] = subject
         msg['From'] = email_user
         msg['To'] = email_user
 
-        logger.info("Attempting to connect to SMTP server...")
-        with smtplib.SMTP('smtp.gmail.com', 587) as server:
-            logger.info("Connected to SMTP server, initiating TLS...")
-            server.starttls()
-            logger.info("Attempting login...")
-            server.login(email_user, email_password)
-            logger.info("Sending email notification...")
-            server.send_message(msg)
-            logger.info("Email notification sent successfully")
-            return True
+        logger.info("Getting SMTP connection...")
+        with _smtp_lock:
+            try:
+                server = _get_smtp(email_user, email_password)
+                logger.info("Sending email notification...")
+                # as_bytes skips send_message's internal str round trip and
+                # policy.SMTP emits CRLF line endings directly
+                server.sendmail(email_user, [email_user], msg.as_bytes(policy=policy.SMTP))
+            except Exception:
+                # Drop a possibly broken connection so the next attempt reconnects
+                _close_smtp()
+                raise
+        logger.info("Email notification sent successfully")
+        return True
 
+    except _TRANSIENT_SMTP_ERRORS as e:
+        # Propagate so the retry decorator gets to back off and reconnect;
+        # the pooled connection was already dropped above
+        logger.warning(f"Transient SMTP failure, will retry: {str(e)}")
+        raise
     except Exception as e:
         logger.error(f"Failed to send email notification: {str(e)}")
         if os.getenv('GITHUB_ACTIONS'):
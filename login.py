@@ -1,116 +1,115 @@
-import os
 import logging
+import random
 import time
-from urllib.parse import urlparse
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from driver_setup import setup_driver, random_delay
-from utils import wait_for_element
-from tenacity import retry, stop_after_attempt, wait_exponential
+from driver_setup import setup_driver
+from utils import wait_for_element, dump_page_source
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 logger = logging.getLogger(__name__)
 
-def normalize_url(url: str) -> str:
-    """Normalize URL for comparison"""
-    parsed = urlparse(url.lower())
-    # Remove protocol and www
-    domain = parsed.netloc.replace('www.', '')
-    path = parsed.path.rstrip('/')
-    return f"{domain}{path}"
-
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
-def login(username: str, password: str) -> webdriver.Chrome:
-    """Login to the Bridge platform with retry logic"""
-    driver = None
+# One regex covers every accepted form of the post-login notifications URL
+_NOTIFICATIONS_URL_PATTERN = r"lbridge\.com/[Ii]nterpreters/notifications"
+
+LOGIN_URL = "https://www.lbridge.com/Login.aspx"
+
+class LoginFormMissing(Exception):
+    """Raised when an expected login form element is not present"""
+    pass
+
+class LoginFailed(Exception):
+    """Raised when submitting the form does not reach the notifications page"""
+    pass
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=2, max=10),
+    # Form-level flakiness retries against the same driver: reloading the
+    # login page costs ~1s versus ~10s for a full Chrome restart
+    retry=retry_if_exception_type((LoginFormMissing, TimeoutException))
+)
+def _perform_login(driver, username: str, password: str):
+    """Fill in and submit the login form, retrying on the same driver
+
+    Raises:
+        LoginFormMissing: A form element was not found
+        LoginFailed: The form was submitted but login did not succeed
+    """
+    driver.get(LOGIN_URL)
+
+    # wait_for_element already blocks until each element exists, so no
+    # blind sleeps are needed between lookups
+    username_field = wait_for_element(driver, By.NAME, 'ctl00$MainContent$txtUserName', timeout=15, description="username field")
+    if not username_field:
+        raise LoginFormMissing("Username field not found")
+
+    password_field = wait_for_element(driver, By.NAME, 'ctl00$MainContent$txtPassword', timeout=15, description="password field")
+    if not password_field:
+        raise LoginFormMissing("Password field not found")
+
+    submit_button = wait_for_element(driver, By.NAME, 'ctl00$MainContent$cmdSubmit', timeout=15, description="submit button")
+    if not submit_button:
+        raise LoginFormMissing("Submit button not found")
+
+    # Fill in login form with short jittered pauses; enough to look like
+    # typing without the 2-5s sleeps that dominated login wall time
+    username_field.clear()
+    username_field.send_keys(username)
+    time.sleep(random.uniform(0.15, 0.5))
+
+    password_field.clear()
+    password_field.send_keys(password)
+    time.sleep(random.uniform(0.15, 0.5))
+
+    logger.info("Submitting login form...")
+    submit_button.click()
+
+    # Wait for redirect after login; a timeout here is transient and
+    # propagates so the form retry reloads the page
+    # (built-in conditions run without a Python lambda or urlparse per poll)
+    WebDriverWait(driver, 10).until(EC.url_changes(LOGIN_URL))
+
+    # Check if login was successful; one regex poll covers all
+    # accepted notifications-page URL forms
     try:
+        WebDriverWait(driver, 5).until(EC.url_matches(_NOTIFICATIONS_URL_PATTERN))
+    except TimeoutException:
+        logger.error(f"Login failed. Current URL: {driver.current_url}")
+        dump_page_source(driver, "login failure")
+        raise LoginFailed(f"Did not reach notifications page (url: {driver.current_url})")
+
+    logger.info(f"Login successful! Current URL: {driver.current_url}")
+
+def login(username: str, password: str, driver: webdriver.Chrome = None) -> webdriver.Chrome:
+    """Login to the Bridge platform, reusing one Chrome across form retries
+
+    Args:
+        username: Bridge account username
+        password: Bridge account password
+        driver: Optional pre-built driver (e.g. from a DriverPool); when
+            given, it is reused instead of spawning a new Chrome and is
+            left running on failure so the pool keeps a healthy driver
+    """
+    owns_driver = driver is None
+    if owns_driver:
         logger.info("Setting up WebDriver...")
-        driver = setup_driver()
+        driver = setup_driver()  # setup_driver carries its own retry policy
         if not driver:
             logger.error("Failed to set up WebDriver")
             return None
 
+    try:
         logger.info("Attempting to login...")
-        driver.get("https://www.lbridge.com/Login.aspx")
-        
-        # Add random delay before login
-        random_delay()
-        
-        # Wait for login form elements with random delays between actions
-        username_field = wait_for_element(driver, By.NAME, 'ctl00$MainContent$txtUserName', timeout=15, description="username field")
-        if not username_field:
-            logger.error("Username field not found")
-            if driver:
-                driver.quit()
-            return None
-            
-        random_delay()
-        password_field = wait_for_element(driver, By.NAME, 'ctl00$MainContent$txtPassword', timeout=15, description="password field")
-        if not password_field:
-            logger.error("Password field not found")
-            if driver:
-                driver.quit()
-            return None
-            
-        random_delay()
-        submit_button = wait_for_element(driver, By.NAME, 'ctl00$MainContent$cmdSubmit', timeout=15, description="submit button")
-        if not submit_button:
-            logger.error("Submit button not found")
-            if driver:
-                driver.quit()
-            return None
-        
-        # Fill in login form with random delays
-        username_field.clear()
-        username_field.send_keys(username)
-        random_delay()
-        
-        password_field.clear()
-        password_field.send_keys(password)
-        random_delay()
-        
-        logger.info("Submitting login form...")
-        submit_button.click()
-        
-        # Wait for redirect after login
-        try:
-            WebDriverWait(driver, 10).until(
-                lambda d: normalize_url(d.current_url) != normalize_url("https://www.lbridge.com/Login.aspx")
-            )
-            
-            # Check if login was successful
-            current_url = normalize_url(driver.current_url)
-            expected_urls = [
-                normalize_url("lbridge.com/interpreters/notifications"),
-                normalize_url("lbridge.com/Interpreters/notifications"),
-                normalize_url("www.lbridge.com/interpreters/notifications")
-            ]
-            
-            if any(current_url == expected for expected in expected_urls):
-                logger.info(f"Login successful! Current URL: {driver.current_url}")
-                return driver
-            else:
-                logger.error(f"Login failed. Current URL: {driver.current_url}")
-                if os.getenv('GITHUB_ACTIONS'):
-                    logger.error(f"Page source:\n{driver.page_source}")
-                if driver:
-                    driver.quit()
-                return None
-                
-        except TimeoutException:
-            logger.error("Timeout waiting for login redirect")
-            if os.getenv('GITHUB_ACTIONS'):
-                logger.error(f"Page source at timeout:\n{driver.page_source}")
-            if driver:
-                driver.quit()
-            return None
-            
+        _perform_login(driver, username, password)
+        return driver
     except Exception as e:
         logger.error(f"Error during login: {str(e)}")
         import traceback
         logger.error(f"Full traceback:\n{traceback.format_exc()}")
-        if driver:
+        if owns_driver:
             driver.quit()
-        raise  # Re-raise for retry mechanism
+        return None
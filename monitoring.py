@@ -1,14 +1,51 @@
 import os
 import json
 import time
+import heapq
+import hashlib
+import atexit
+import threading
+from collections import Counter, deque
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import logging
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
+from operator import itemgetter
+
+try:
+    import orjson  # optional: C-level JSON, much faster on the save path
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Report listings show only the hottest entries per category; the full
+# tallies stay in the counters (and the spill history) on disk
+_TOP_N = 20
+
+def _build_config():
+    """Resolve the environment-dependent health thresholds"""
+    is_production = os.getenv('PRODUCTION', 'false').lower() == 'true'
+    return is_production, {
+        'error_rate': 0.2 if is_production else 0.3,
+        'processing_time': 300 if is_production else 600,  # 5 min prod, 10 min dev
+        'validation_errors': 50 if is_production else 100,
+        'success_gap_hours': 2 if is_production else 4
+    }
+
+# Resolved once at import: PRODUCTION doesn't change mid-process and the
+# health/report paths were rebuilding this dict on every call
+_IS_PROD, _THRESHOLDS = _build_config()
+
+def _json_default(obj):
+    """Serialize deque histories and Counters natively; stringify the rest"""
+    if isinstance(obj, deque):
+        return list(obj)
+    if isinstance(obj, Counter):
+        return dict(obj)
+    return str(obj)
+
+@dataclass(slots=True)
 class MetricsData:
     total_runs: int = 0
     successful_runs: int = 0
@@ -22,28 +59,62 @@ class MetricsData:
     validation_error_counts: Dict[str, int] = None
     success_counts: Dict[str, int] = None
     recent_processing_times: List[float] = None
-    recent_error_rates: List[float] = None
+    recent_run_snapshots: List[List[int]] = None
     max_history_size: int = 100
+    max_unique_error_types: int = 256
 
     def __post_init__(self):
-        if self.error_counts is None:
-            self.error_counts = {}
-        if self.validation_error_counts is None:
-            self.validation_error_counts = {}
-        if self.success_counts is None:
-            self.success_counts = {}
-        if self.recent_processing_times is None:
-            self.recent_processing_times = []
-        if self.recent_error_rates is None:
-            self.recent_error_rates = []
+        # Counters: c[k] += 1 is a single C-level access instead of the
+        # get(k, 0) + 1 double lookup, and missing keys read as 0
+        self.error_counts = Counter(self.error_counts or {})
+        self.validation_error_counts = Counter(self.validation_error_counts or {})
+        self.success_counts = Counter(self.success_counts or {})
+        # Bounded histories as deques: append evicts the oldest entry in
+        # O(1) instead of the O(n) list.pop(0) shuffle
+        self.recent_processing_times = deque(self.recent_processing_times or [],
+                                             maxlen=self.max_history_size)
+        self.recent_run_snapshots = deque(self.recent_run_snapshots or [],
+                                          maxlen=self.max_history_size)
+
+# Field names resolved once; with slots=True there is no instance
+# __dict__ to hand to the serializer
+_METRIC_FIELDS = tuple(f.name for f in fields(MetricsData))
 
 class Metrics:
     """Tracks application metrics and health data"""
     
+    # Static display strings, built once per class instead of per call
+    _TREND_INDICATORS = {
+        'increasing': '📈 Increasing',
+        'decreasing': '📉 Decreasing',
+        'stable': '📊 Stable'
+    }
+    _ENV_INDICATOR = "🏭 Production" if _IS_PROD else "🔧 Development"
+    
     def __init__(self, metrics_file: str = "data/metrics.json"):
         self.metrics_file = metrics_file
         self.metrics = self._load_metrics()
         self._ensure_data_dir()
+        self._rebuild_validation_cache()
+        # Parse the persisted run timestamps once; health checks read the
+        # datetime objects instead of re-running fromisoformat per call
+        self._last_success_dt = (datetime.fromisoformat(self.metrics.last_successful_run)
+                                 if self.metrics.last_successful_run else None)
+        self._last_failure_dt = (datetime.fromisoformat(self.metrics.last_failed_run)
+                                 if self.metrics.last_failed_run else None)
+        # Counter updates only mark the state dirty; a background thread
+        # coalesces bursts of record_* calls into one file write per
+        # flush interval, and end_run/atexit flush synchronously
+        self._save_lock = threading.Lock()
+        # Guards counter mutations: record_* may be called from worker
+        # threads while the flush thread serializes
+        self._counts_lock = threading.Lock()
+        self._last_saved_digest = None
+        self._dirty = False
+        self._flush_interval = 5.0
+        self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flush_thread.start()
+        atexit.register(self.flush)
         
     def _ensure_data_dir(self):
         """Ensure the data directory exists"""
@@ -53,62 +124,137 @@ class Metrics:
         """Load metrics from file or create new metrics"""
         try:
             if os.path.exists(self.metrics_file):
-                with open(self.metrics_file, 'r') as f:
-                    data = json.load(f)
-                return MetricsData(**data)
+                with open(self.metrics_file, 'rb') as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                # Drop fields from older file layouts (e.g. the retired
+                # recent_error_rates list) instead of failing the load
+                valid = {f.name for f in fields(MetricsData)}
+                return MetricsData(**{k: v for k, v in data.items() if k in valid})
         except Exception as e:
             logger.error(f"Error loading metrics: {str(e)}")
         return MetricsData()
         
+    def _cap_counts(self):
+        """Spill the long tail of unique error keys to a history file
+        
+        Bounds the per-save payload to the hottest keys no matter how many
+        distinct error strings a long deployment accumulates; evicted
+        entries are appended to data/metrics.history.jsonl instead of
+        being rewritten on every save.
+        """
+        cap = self.metrics.max_unique_error_types
+        evicted = {}
+        with self._counts_lock:
+            for name in ('error_counts', 'validation_error_counts'):
+                counts = getattr(self.metrics, name)
+                if len(counts) <= cap:
+                    continue
+                keep = dict(heapq.nlargest(cap, counts.items(), key=itemgetter(1)))
+                evicted[name] = {k: v for k, v in counts.items() if k not in keep}
+                setattr(self.metrics, name, Counter(keep))
+            if 'validation_error_counts' in evicted:
+                # Cached totals now cover only the retained keys
+                self._rebuild_validation_cache()
+        if evicted:
+            try:
+                history_path = os.path.join(
+                    os.path.dirname(self.metrics_file), 'metrics.history.jsonl')
+                entry = json.dumps({'timestamp': datetime.now().isoformat(),
+                                    'evicted': evicted})
+                with open(history_path, 'a') as f:
+                    f.write(entry + '\n')
+            except Exception as e:
+                logger.error(f"Error spilling metrics history: {str(e)}")
+        
     def _save_metrics(self):
-        """Save metrics to file"""
+        """Save metrics to file atomically, skipping no-op writes"""
         try:
-            with open(self.metrics_file, 'w') as f:
-                json.dump(asdict(self.metrics), f, indent=2, default=str)
+            self._cap_counts()
+            with self._save_lock:
+                # Snapshot mutable containers under the counts lock before
+                # serializing: a record_* call inserting a key while the
+                # flush thread iterates the live dict would raise
+                # "dictionary changed size during iteration" and drop the
+                # save. Scalars are copied as-is; asdict() would deep-copy
+                # even immutable fields
+                with self._counts_lock:
+                    payload = {}
+                    for name in _METRIC_FIELDS:
+                        value = getattr(self.metrics, name)
+                        if isinstance(value, Counter):
+                            value = dict(value)
+                        elif isinstance(value, deque):
+                            value = list(value)
+                        payload[name] = value
+                if orjson is not None:
+                    content = orjson.dumps(payload, option=orjson.OPT_INDENT_2,
+                                           default=_json_default)
+                else:
+                    content = json.dumps(payload, indent=2, default=_json_default).encode()
+                digest = hashlib.blake2b(content, digest_size=16).digest()
+                if digest == self._last_saved_digest:
+                    self._dirty = False
+                    return
+                # Truncate-then-stream on the live file would expose a
+                # partial payload to crashes and concurrent readers; write
+                # aside and rename instead
+                tmp_path = self.metrics_file + '.tmp'
+                with open(tmp_path, 'wb') as f:
+                    f.write(content)
+                os.replace(tmp_path, self.metrics_file)
+                self._last_saved_digest = digest
+                self._dirty = False
         except Exception as e:
             logger.error(f"Error saving metrics: {str(e)}")
             
+    def _flush_loop(self):
+        """Periodically persist dirty metrics from a background thread"""
+        while True:
+            time.sleep(self._flush_interval)
+            if self._dirty:
+                self._save_metrics()
+                
+    def flush(self):
+        """Persist any unsaved metric updates immediately"""
+        if self._dirty:
+            self._save_metrics()
+            
     def start_run(self):
         """Start tracking a new run"""
         self.run_start_time = time.time()
         self.metrics.total_runs += 1
-        self._save_metrics()
+        self._dirty = True
         
     def _get_trend_indicator(self, trend: str) -> str:
         """Convert trend string to visual indicator"""
-        indicators = {
-            'increasing': '📈 Increasing',
-            'decreasing': '📉 Decreasing',
-            'stable': '📊 Stable'
-        }
-        return indicators.get(trend, '❓ Unknown')
+        return self._TREND_INDICATORS.get(trend, '❓ Unknown')
 
     def end_run(self, success: bool, assignments_count: int = 0, notifications_sent: int = 0):
         """Record the end of a run"""
         run_time = time.time() - self.run_start_time
         
         # Update run counts
+        now = datetime.now()
         if success:
             self.metrics.successful_runs += 1
-            self.metrics.last_successful_run = datetime.now().isoformat()
+            self.metrics.last_successful_run = now.isoformat()
+            self._last_success_dt = now
         else:
             self.metrics.failed_runs += 1
-            self.metrics.last_failed_run = datetime.now().isoformat()
+            self.metrics.last_failed_run = now.isoformat()
+            self._last_failure_dt = now
             
         # Update processing metrics
         self.metrics.total_assignments_processed += assignments_count
         self.metrics.total_notifications_sent += notifications_sent
         
-        # Update recent metrics history
+        # Update recent metrics history; the deques evict old entries.
+        # Store the raw (total, failed) counters - the ratio is derived on
+        # read instead of persisting a redundant float per run
         self.metrics.recent_processing_times.append(run_time)
-        if len(self.metrics.recent_processing_times) > self.metrics.max_history_size:
-            self.metrics.recent_processing_times.pop(0)
-            
-        if self.metrics.total_runs > 0:
-            error_rate = self.metrics.failed_runs / self.metrics.total_runs
-            self.metrics.recent_error_rates.append(error_rate)
-            if len(self.metrics.recent_error_rates) > self.metrics.max_history_size:
-                self.metrics.recent_error_rates.pop(0)
+        self.metrics.recent_run_snapshots.append(
+            [self.metrics.total_runs, self.metrics.failed_runs])
         
         # Update average processing time with weighted moving average
         if self.metrics.average_processing_time == 0:
@@ -120,28 +266,64 @@ class Metrics:
             
         self._save_metrics()
         
+    def _rebuild_validation_cache(self):
+        """Recompute cached validation totals from the loaded counts"""
+        self._vt_total = 0
+        self._vt_categories = {'service_type': 0, 'date_time': 0, 'other': 0}
+        for error_type, count in self.metrics.validation_error_counts.items():
+            self._bump_validation_cache(error_type, count)
+        
+    def _bump_validation_cache(self, error_type: str, count: int = 1):
+        """Classify an error key once and update the running totals"""
+        lkey = error_type.lower()
+        self._vt_total += count
+        matched = False
+        if 'service_type' in lkey:
+            self._vt_categories['service_type'] += count
+            matched = True
+        if 'date' in lkey or 'time' in lkey:
+            self._vt_categories['date_time'] += count
+            matched = True
+        if not matched:
+            self._vt_categories['other'] += count
+        
     def record_success(self, success_type: str):
         """Record a successful operation"""
-        self.metrics.success_counts[success_type] = self.metrics.success_counts.get(success_type, 0) + 1
-        self._save_metrics()
+        with self._counts_lock:
+            self.metrics.success_counts[success_type] += 1
+        self._dirty = True
 
     def record_error(self, error_type: str):
         """Record an error occurrence"""
-        self.metrics.error_counts[error_type] = self.metrics.error_counts.get(error_type, 0) + 1
-        self._save_metrics()
+        with self._counts_lock:
+            self.metrics.error_counts[error_type] += 1
+        self._dirty = True
         
     def record_validation_error(self, error_type: str):
         """Record a validation error occurrence"""
-        self.metrics.validation_error_counts[error_type] = self.metrics.validation_error_counts.get(error_type, 0) + 1
-        self._save_metrics()
+        with self._counts_lock:
+            self.metrics.validation_error_counts[error_type] += 1
+            self._bump_validation_cache(error_type)
+        self._dirty = True
+        
+    def record_validation_errors(self, error_types: List[str]):
+        """Record a batch of validation errors in one call"""
+        if not error_types:
+            return
+        with self._counts_lock:
+            counts = self.metrics.validation_error_counts
+            for error_type in error_types:
+                counts[error_type] += 1
+                self._bump_validation_cache(error_type)
+        self._dirty = True
         
     def get_health_status(self) -> Dict:
         """Get current health status of the application"""
         now = datetime.now()
         
-        # Parse timestamps
-        last_success = datetime.fromisoformat(self.metrics.last_successful_run) if self.metrics.last_successful_run else None
-        last_failure = datetime.fromisoformat(self.metrics.last_failed_run) if self.metrics.last_failed_run else None
+        # Timestamps are parsed once at load/record time
+        last_success = self._last_success_dt
+        last_failure = self._last_failure_dt
         
         # Calculate health indicators
         status = {
@@ -154,14 +336,8 @@ class Metrics:
             }
         }
         
-        # Environment-specific thresholds
-        is_production = os.getenv('PRODUCTION', 'false').lower() == 'true'
-        thresholds = {
-            'error_rate': 0.2 if is_production else 0.3,
-            'processing_time': 300 if is_production else 600,  # 5 min prod, 10 min dev
-            'validation_errors': 50 if is_production else 100,
-            'success_gap_hours': 2 if is_production else 4
-        }
+        # Environment-specific thresholds, resolved at import time
+        thresholds = _THRESHOLDS
         
         # Check for recent successful runs
         if last_success:
@@ -192,25 +368,14 @@ class Metrics:
                 f"High average processing time: {self.metrics.average_processing_time:.1f}s"
             )
             
-        # Check validation errors with categorization
-        validation_errors = self.metrics.validation_error_counts
-        total_validation_errors = sum(validation_errors.values())
+        # Check validation errors using the cached totals: the categories
+        # are maintained incrementally as errors are recorded instead of
+        # re-scanning and re-lowercasing the whole dict on every check
+        total_validation_errors = self._vt_total
         
         if total_validation_errors > thresholds['validation_errors']:
-            # Categorize validation errors
-            error_categories = {
-                'service_type': sum(count for type_, count in validation_errors.items() 
-                                  if 'service_type' in type_.lower()),
-                'date_time': sum(count for type_, count in validation_errors.items() 
-                                if 'date' in type_.lower() or 'time' in type_.lower()),
-                'other': sum(count for type_, count in validation_errors.items() 
-                           if 'service_type' not in type_.lower() 
-                           and 'date' not in type_.lower() 
-                           and 'time' not in type_.lower())
-            }
-            
             # Add specific warnings for high-count categories
-            for category, count in error_categories.items():
+            for category, count in self._vt_categories.items():
                 if count > thresholds['validation_errors'] * 0.5:  # If category makes up >50% of threshold
                     status['warnings'].append(
                         f"High number of {category} validation errors: {count}"
@@ -221,10 +386,7 @@ class Metrics:
     def get_metrics_report(self) -> str:
         """Generate a human-readable metrics report"""
         status = self.get_health_status()
-        is_production = os.getenv('PRODUCTION', 'false').lower() == 'true'
-        
-        # Environment indicator
-        env_indicator = "🏭 Production" if is_production else "🔧 Development"
+        env_indicator = self._ENV_INDICATOR
         
         report = [
             "=== Bridge Assignments Monitor Health Report ===",
@@ -249,12 +411,16 @@ class Metrics:
             
             # Add recent metrics if available
             if self.metrics.recent_processing_times:
-                recent_avg = sum(self.metrics.recent_processing_times[-10:]) / min(10, len(self.metrics.recent_processing_times))
+                # deques don't slice; the history is capped at 100 entries
+                # so materializing the tail is cheap
+                window = list(self.metrics.recent_processing_times)[-10:]
+                recent_avg = sum(window) / len(window)
                 report.append(f"- Recent Average Processing Time: {recent_avg:.1f}s")
             
-            if self.metrics.recent_error_rates:
-                recent_error_rate = self.metrics.recent_error_rates[-1]
-                report.append(f"- Recent Error Rate: {recent_error_rate:.1%}")
+            if self.metrics.recent_run_snapshots:
+                total, failed = self.metrics.recent_run_snapshots[-1]
+                if total:
+                    report.append(f"- Recent Error Rate: {failed / total:.1%}")
         
         report.extend([
             "",
@@ -267,8 +433,8 @@ class Metrics:
         ])
         
         # Add success counts sorted by frequency
-        success_items = sorted(self.metrics.success_counts.items(), 
-                             key=lambda x: x[1], reverse=True)
+        success_items = heapq.nlargest(_TOP_N, self.metrics.success_counts.items(),
+                                       key=itemgetter(1))
         for success_type, count in success_items:
             report.append(f"  • {success_type}: {count}")
             
@@ -279,8 +445,8 @@ class Metrics:
         ])
         
         # Add error counts sorted by frequency
-        error_items = sorted(self.metrics.error_counts.items(), 
-                           key=lambda x: x[1], reverse=True)
+        error_items = heapq.nlargest(_TOP_N, self.metrics.error_counts.items(),
+                                     key=itemgetter(1))
         for error_type, count in error_items:
             report.append(f"  • {error_type}: {count}")
             
@@ -291,8 +457,8 @@ class Metrics:
         ])
         
         # Add validation error counts sorted by frequency
-        validation_items = sorted(self.metrics.validation_error_counts.items(), 
-                                key=lambda x: x[1], reverse=True)
+        validation_items = heapq.nlargest(_TOP_N, self.metrics.validation_error_counts.items(),
+                                          key=itemgetter(1))
         for error_type, count in validation_items:
             report.append(f"  • {error_type}: {count}")
             
@@ -315,5 +481,12 @@ class Metrics:
                 
         return "\n".join(report)
 
-# Global metrics instance
-metrics = Metrics()
+# Global metrics instance, constructed lazily (PEP 562): importing this
+# module no longer pays the metrics-file read and directory creation -
+# the first access to monitoring.metrics does
+def __getattr__(name):
+    if name == 'metrics':
+        global metrics
+        metrics = Metrics()
+        return metrics
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,16 +1,60 @@
 import os
 import json
+import hashlib
+import re
+import functools
+import bisect
 import logging
+import tempfile
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 
+try:
+    import orjson  # optional: C-level JSON for the snapshot read/write path
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Core identifying fields used to key an assignment; info/comments are
+# deliberately excluded so minor edits there don't register as new entries
+_KEY_FIELDS = ('customer', 'date_time', 'language', 'service_type')
+
+# Timestamp-ish bookkeeping fields excluded from comparisons; built once
+# here instead of per _clean_assignment call
+_IGNORE_FIELDS = frozenset({'timestamp', 'last_updated', 'created_at', 'updated_at'})
+
+# The post-clean key universe in sorted order; rows matching it (the
+# normal case) skip the per-row sort in the diff loop
+_CANONICAL_FIELDS = ('comments', 'customer', 'date_time', 'info', 'language', 'service_type')
+_CANONICAL_FIELDS_SET = frozenset(_CANONICAL_FIELDS)
+
+# Whitespace runs collapse via one precompiled C-level substitution
+# instead of split() materializing a word list per call
+_WS_RE = re.compile(r'\s+')
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_str(value: str) -> str:
+    """Collapse whitespace and lowercase a string
+    
+    Memoized: comparisons hit the same small set of customer, language
+    and service strings over and over, so most calls become a dict hit.
+    """
+    return _WS_RE.sub(' ', value).strip().lower()
+
 class AssignmentStorage:
     """Handles persistent storage of assignments using JSON"""
     
     def __init__(self, storage_file: str = "data/assignments.json"):
         self.storage_file = storage_file
+        # Snapshot archive as an append-only log: one JSON line per
+        # distinct snapshot, so saves never rewrite old history
+        self.history_file = os.path.join(
+            os.path.dirname(storage_file) or '.', 'history.jsonl')
+        # (mtime_ns, size) signature and parsed payload of the last read;
+        # lets repeat reads within a run skip the JSON parse entirely
+        self._read_cache = None
+        self._last_history_hash = self._read_last_history_hash()
         self._ensure_data_dir()
         
     def _ensure_data_dir(self):
@@ -18,11 +62,18 @@ class AssignmentStorage:
         os.makedirs(os.path.dirname(self.storage_file), exist_ok=True)
         
     def _read_storage(self) -> Dict:
-        """Read the storage file"""
+        """Read the storage file, reusing the parsed payload when unchanged"""
         try:
             if os.path.exists(self.storage_file):
-                with open(self.storage_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                st = os.stat(self.storage_file)
+                sig = (st.st_mtime_ns, st.st_size)
+                if self._read_cache is not None and self._read_cache[0] == sig:
+                    return self._read_cache[1]
+                with open(self.storage_file, 'rb') as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                self._read_cache = (sig, data)
+                return data
             return {
                 'last_updated': None,
                 'assignments': [],
@@ -37,15 +88,78 @@ class AssignmentStorage:
             }
             
     def _write_storage(self, data: Dict) -> bool:
-        """Write to the storage file"""
+        """Write to the storage file atomically"""
         try:
-            with open(self.storage_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Serialize to one buffer first: json.dump streams many small
+            # writes through the io machinery, one write lets the OS see a
+            # single buffer
+            if orjson is not None:
+                content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                content = json.dumps(data, indent=2, ensure_ascii=False).encode()
+            # Write to a tempfile in the same directory and rename over the
+            # target, so an interrupted run never leaves a truncated file
+            # for the next run to mis-read
+            tmp_fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(self.storage_file) or '.', suffix='.tmp'
+            )
+            try:
+                with os.fdopen(tmp_fd, 'wb') as f:
+                    f.write(content)
+                    # Force the data to disk before the rename makes it
+                    # visible, so a crash can't publish an empty tempfile
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.storage_file)
+                # fsync the directory too, so the rename entry itself
+                # survives a power loss, not just the file data
+                dir_fd = os.open(os.path.dirname(self.storage_file) or '.', os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+                # The just-written payload is the file's content; cache it
+                # under the fresh stat signature so the next read skips
+                # the parse instead of re-reading what we just wrote
+                st = os.stat(self.storage_file)
+                self._read_cache = ((st.st_mtime_ns, st.st_size), data)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
             return True
         except Exception as e:
             logger.error(f"Error writing storage: {str(e)}")
             return False
             
+    def _read_last_history_hash(self) -> Optional[str]:
+        """Fingerprint of the newest entry in the history log, if any"""
+        try:
+            with open(self.history_file, 'rb') as f:
+                lines = f.read().splitlines()
+            for line in reversed(lines):
+                if line.strip():
+                    entry = orjson.loads(line) if orjson is not None else json.loads(line)
+                    return entry.get('hash')
+        except OSError:
+            pass
+        except Exception as e:
+            logger.error(f"Error reading history log: {str(e)}")
+        return None
+        
+    def _append_history(self, entry: Dict) -> None:
+        """Append one snapshot entry to the history log"""
+        try:
+            if orjson is not None:
+                line = orjson.dumps(entry) + b'\n'
+            else:
+                line = json.dumps(entry, ensure_ascii=False).encode('utf-8') + b'\n'
+            with open(self.history_file, 'ab') as f:
+                f.write(line)
+            self._last_history_hash = entry.get('hash')
+        except Exception as e:
+            logger.error(f"Error appending history: {str(e)}")
+        
     def _clean_old_history(self, history: List[Dict]) -> List[Dict]:
         """
         Clean history entries older than 7 days
@@ -57,10 +171,18 @@ class AssignmentStorage:
             List of filtered history entries
         """
         seven_days_ago = (datetime.now() - timedelta(days=7)).isoformat()
-        return [
-            entry for entry in history 
-            if entry.get('timestamp') and entry['timestamp'] > seven_days_ago
-        ]
+        # Entries are appended chronologically, so the cutoff can be found
+        # by bisection on the ISO timestamps instead of scanning them all
+        try:
+            idx = bisect.bisect_right(history, seven_days_ago,
+                                      key=lambda entry: entry['timestamp'])
+        except (KeyError, TypeError):
+            # Legacy entries without timestamps: fall back to the filter
+            return [
+                entry for entry in history 
+                if entry.get('timestamp') and entry['timestamp'] > seven_days_ago
+            ]
+        return history[idx:]
             
     def save_assignments(self, assignments: List[Dict]) -> bool:
         """
@@ -75,15 +197,27 @@ class AssignmentStorage:
         try:
             data = self._read_storage()
             
-            # Update history
-            if data['assignments']:
-                history_entry = {
-                    'timestamp': data['last_updated'],
-                    'assignments': data['assignments']
-                }
-                data['history'].append(history_entry)
+            # A payload identical to the stored snapshot needs no write at
+            # all; the scheduled no-change poll is the dominant case
+            if data['assignments'] and \
+                    self._fingerprint(data['assignments']) == self._fingerprint(assignments):
+                return True
+            
+            # Archive the outgoing snapshot to the append-only log;
+            # entries without a timestamp would break the sorted-order
+            # assumption, so skip the pre-first-save state. The hash
+            # dedupes repeats of the latest snapshot (e.g. a listing
+            # disappearing and coming back) without rereading the log
+            if data['assignments'] and data['last_updated']:
+                snapshot_hash = self._fingerprint(data['assignments'])
+                if snapshot_hash != self._last_history_hash:
+                    self._append_history({
+                        'timestamp': data['last_updated'],
+                        'assignments': data['assignments'],
+                        'hash': snapshot_hash
+                    })
             
-            # Clean old history entries
+            # Age out any history still embedded from the old layout
             data['history'] = self._clean_old_history(data['history'])
             
             # Update current assignments
@@ -119,7 +253,14 @@ class AssignmentStorage:
         """
         try:
             data = self._read_storage()
-            return self._clean_old_history(data['history'])
+            # Legacy in-file entries predate the log, so concatenation
+            # preserves chronological order
+            entries = list(data['history'])
+            if os.path.exists(self.history_file):
+                loads = orjson.loads if orjson is not None else json.loads
+                with open(self.history_file, 'rb') as f:
+                    entries.extend(loads(line) for line in f if line.strip())
+            return self._clean_old_history(entries)
         except Exception as e:
             logger.error(f"Error getting assignment history: {str(e)}")
             return []
@@ -128,32 +269,25 @@ class AssignmentStorage:
         """Normalize a value for comparison"""
         if not isinstance(value, str):
             return str(value)
-        
-        # Replace multiple spaces with single space, strip, and convert to lowercase
-        return ' '.join(value.split()).lower()
+        return _normalize_str(value)
     
-    def _get_assignment_key(self, assignment: Dict) -> tuple:
-        """Get unique identifier for assignment using all main fields"""
-        # Only use core identifying fields for the key
-        # This prevents minor changes in info/comments from causing false duplicates
-        return (
-            self._normalize_value(assignment.get('customer', '')),
-            self._normalize_value(assignment.get('date_time', '')),
-            self._normalize_value(assignment.get('language', '')),
-            self._normalize_value(assignment.get('service_type', ''))
-        )
+    def _get_assignment_key(self, cleaned: Dict) -> tuple:
+        """Get unique identifier from an already-cleaned assignment
+        
+        Callers pass the output of _clean_assignment, whose values are
+        normalized, so no further string work is needed here.
+        """
+        get = cleaned.get
+        return tuple(get(field, '') for field in _KEY_FIELDS)
         
     def _clean_assignment(self, assignment: Dict) -> Dict:
         """Clean assignment for comparison"""
-        # List of fields to ignore in comparison
-        ignore_fields = {'timestamp', 'last_updated', 'created_at', 'updated_at'}
-        
         cleaned = {}
         for key, value in assignment.items():
             key = key.lower()  # Normalize key to lowercase
             
             # Skip timestamp-related fields
-            if key in ignore_fields:
+            if key in _IGNORE_FIELDS:
                 continue
             
             # Handle missing or empty values
@@ -166,19 +300,20 @@ class AssignmentStorage:
             
         return cleaned
     
+    def _fingerprint(self, assignments: List[Dict]) -> str:
+        """Stable digest of the cleaned assignments for cheap change detection"""
+        cleaned = sorted(
+            tuple(sorted(self._clean_assignment(a).items())) for a in assignments
+        )
+        return hashlib.blake2b(repr(cleaned).encode(), digest_size=16).hexdigest()
+
     def _assignments_equal(self, a1: Dict, a2: Dict) -> bool:
-        """Compare two assignments, ignoring case and space differences"""
-        # Get all unique keys
-        all_keys = set(a1.keys()) | set(a2.keys())
-        
-        for key in all_keys:
-            # Get values, defaulting to 'n/a' for missing values
-            v1 = self._normalize_value(a1.get(key, 'n/a'))
-            v2 = self._normalize_value(a2.get(key, 'n/a'))
-            
-            if v1 != v2:
-                return False
-        return True
+        """Compare two cleaned assignments
+        
+        Both sides come out of _clean_assignment fully normalized, so
+        plain dict equality is exact and runs at C level.
+        """
+        return a1 == a2
     
     def compare_assignments(self, new_assignments: List[Dict]) -> tuple[bool, List[str], List[Dict]]:
         """
@@ -192,6 +327,11 @@ class AssignmentStorage:
         """
         changes = []
         current_assignments = self.get_assignments()
+
+        # One hash pass over the normalized records is much cheaper than the
+        # set/dict diff below, and most runs see no changes at all
+        if self._fingerprint(new_assignments) == self._fingerprint(current_assignments):
+            return False, [], []
         
         # Fields where case matters
         case_sensitive_fields = {'info', 'comments'}
@@ -206,10 +346,11 @@ class AssignmentStorage:
         new_keys = {self._get_assignment_key(a): (a, orig_a) 
                    for a, orig_a in zip(new_cleaned, new_assignments)}
         
-        # Find added and removed assignments
-        added_keys = set(new_keys.keys()) - set(current_keys.keys())
-        removed_keys = set(current_keys.keys()) - set(new_keys.keys())
-        common_keys = set(current_keys.keys()) & set(new_keys.keys())
+        # Find added and removed assignments. dict_keys views are already
+        # set-like, so operate on them directly instead of copying into sets
+        added_keys = new_keys.keys() - current_keys.keys()
+        removed_keys = current_keys.keys() - new_keys.keys()
+        common_keys = current_keys.keys() & new_keys.keys()
         
         # Collect truly new assignments (use original assignments, not cleaned)
         new_assignments_list = []
@@ -228,25 +369,30 @@ class AssignmentStorage:
             current_cleaned, current_orig = current_keys[key]
             new_cleaned, new_orig = new_keys[key]
             
-            # Only compare if assignments are actually different
-            if not self._assignments_equal(current_cleaned, new_cleaned):
-                # Compare all fields
-                field_changes = []
-                all_fields = set(current_cleaned.keys()) | set(new_cleaned.keys())
-                
-                for field in sorted(all_fields):
-                    current_value = current_cleaned.get(field, 'n/a')
-                    new_value = new_cleaned.get(field, 'n/a')
-                    
-                    if current_value != new_value:
-                        # Use original values for display
-                        orig_current = current_orig.get(field, 'N/A')
-                        orig_new = new_orig.get(field, 'N/A')
-                        if self._normalize_value(orig_current) != self._normalize_value(orig_new):  # Only show if values truly differ
-                            field_changes.append(f"{field}: '{orig_current}' → '{orig_new}'")
+            # Identical cleaned records - the common case - bail out on one
+            # C-level dict equality instead of the per-field walk below
+            if current_cleaned == new_cleaned:
+                continue
+            
+            # Compare all fields; the cleaned values are already normalized
+            # so no further string work is needed to decide a difference
+            field_changes = []
+            all_fields = current_cleaned.keys() | new_cleaned.keys()
+            ordered_fields = (_CANONICAL_FIELDS if all_fields == _CANONICAL_FIELDS_SET
+                              else sorted(all_fields))
+            
+            for field in ordered_fields:
+                current_value = current_cleaned.get(field, 'n/a')
+                new_value = new_cleaned.get(field, 'n/a')
                 
-                if field_changes:  # Only add changes if there are actual differences
-                    changes.append(f"Changes in Assignment (Customer: {key[0]}, Language: {key[2]}, Date/Time: {key[1]}):")
-                    changes.extend([f"  - {change}" for change in field_changes])
+                if current_value != new_value:
+                    # Use original values for display
+                    orig_current = current_orig.get(field, 'N/A')
+                    orig_new = new_orig.get(field, 'N/A')
+                    field_changes.append(f"{field}: '{orig_current}' → '{orig_new}'")
+            
+            if field_changes:  # Only add changes if there are actual differences
+                changes.append(f"Changes in Assignment (Customer: {key[0]}, Language: {key[2]}, Date/Time: {key[1]}):")
+                changes.extend([f"  - {change}" for change in field_changes])
                 
         return bool(changes), changes, new_assignments_list
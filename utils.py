@@ -1,6 +1,5 @@
 import os
 import logging
-import random
 import time
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -9,25 +8,37 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 
 logger = logging.getLogger(__name__)
 
-def random_wait_time():
-    """Generate a random wait time between 1 and 3 seconds"""
-    return random.uniform(1, 3)
+def dump_page_source(driver, context="failure"):
+    """Write the current page source to artifacts/ when DOM dumping is enabled
+
+    Gated behind BRIDGE_DEBUG_DUMP_DOM=1: serializing a multi-MB DOM into
+    the log stream allocates the string twice and CI log viewers truncate
+    it anyway, so the dump goes to a timestamped file instead.
+    """
+    if os.getenv('BRIDGE_DEBUG_DUMP_DOM') != '1':
+        return None
+    try:
+        os.makedirs('artifacts', exist_ok=True)
+        path = os.path.join('artifacts', f"page_source_{int(time.time())}.html")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(driver.page_source)
+        logger.error(f"Page source for {context} written to {path}")
+        return path
+    except Exception as e:
+        logger.error(f"Failed to dump page source: {str(e)}")
+        return None
 
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
 def wait_for_element(driver, by, value, timeout=10, description="element"):
     """Wait for and find an element with explicit wait and retry logic"""
     try:
-        # Add random initial delay
-        initial_delay = random_wait_time()
-        logger.info(f"Adding initial delay of {initial_delay:.2f} seconds before looking for {description}")
-        time.sleep(initial_delay)
-        
-        # Use dynamic timeout with some randomization
-        dynamic_timeout = timeout + random.uniform(0, 2)
-        
-        # Wait for element with detailed logging
-        logger.info(f"Waiting up to {dynamic_timeout:.1f} seconds for {description}")
-        element = WebDriverWait(driver, dynamic_timeout).until(
+        # Wait for element with detailed logging. A 0.1s poll reacts to
+        # the element appearing ~5x sooner than Selenium's 0.5s default;
+        # the old 1-3s random sleeps on either side of the wait cost more
+        # wall time per call than the waits themselves and add no stealth
+        # value on a page load the server can't observe
+        logger.info(f"Waiting up to {timeout:.1f} seconds for {description}")
+        element = WebDriverWait(driver, timeout, poll_frequency=0.1).until(
             EC.presence_of_element_located((by, value))
         )
         
@@ -36,17 +47,10 @@ def wait_for_element(driver, by, value, timeout=10, description="element"):
             return None
             
         logger.info(f"Successfully found {description}")
-        
-        # Add small random delay after finding element
-        post_delay = random_wait_time()
-        logger.info(f"Adding post-delay of {post_delay:.2f} seconds")
-        time.sleep(post_delay)
-        
         return element
     except TimeoutException as e:
         logger.error(f"Timeout waiting for {description}. Element not found with locator: {by}={value}")
-        if os.getenv('GITHUB_ACTIONS'):
-            logger.error(f"Page source at time of error: {driver.page_source}")
+        dump_page_source(driver, f"timeout waiting for {description}")
         raise e  # Re-raise for retry mechanism
     except Exception as e:
         logger.error(f"Error finding {description}: {str(e)}")
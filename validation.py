@@ -1,12 +1,137 @@
 import re
+import sys
+import functools
 from datetime import datetime
 from typing import Dict, List, Optional, Union
 from dataclasses import dataclass
 import logging
 
+try:
+    # Optional C-accelerated edit distance; score_cutoff lets the banded
+    # DP abort as soon as the distance exceeds the typo threshold
+    from rapidfuzz.distance import Levenshtein as _Levenshtein
+except ImportError:
+    _Levenshtein = None
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Sentinel distinguishing a missing field from a None value in one .get
+_MISSING = object()
+
+# Patterns compiled once at import: re caches compiled patterns, but every
+# call through re.match/re.findall still pays the cache hash-and-lookup,
+# which adds up in the per-assignment validation loops
+
+# Date/time embedded in free text, e.g. MM/DD/YYYY HH:MM AM/PM or YYYY-MM-DD HH:MM
+_EMBEDDED_DATE_RE = re.compile(
+    r'(\d{1,2}/\d{1,2}/\d{2,4}\s+\d{1,2}:\d{2}\s*(?:AM|PM)?|\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})'
+)
+
+# Common invalid customer-name patterns (matched against the lowercased,
+# stripped name) combined into one alternation: a single engine traversal
+# instead of one match call per pattern. Branches: empty/whitespace only,
+# numbers only, test entries, unknown, and n/a
+_INVALID_CUSTOMER_RE = re.compile(r'^(?:\s*|[0-9]+|test.*|unknown|n/?a)$')
+
+# Date/time extraction patterns for extract_date_time
+_DATETIME_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r'\b(\d{1,2}/\d{1,2}/\d{2,4}\s+\d{1,2}:\d{2}\s*(?:AM|PM)?)\b',  # MM/DD/YYYY HH:MM AM/PM
+    r'\b(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})\b',  # YYYY-MM-DD HH:MM
+    r'\b(\d{1,2}-\d{1,2}-\d{2,4}\s+\d{1,2}:\d{2}\s*(?:AM|PM)?)\b',  # MM-DD-YYYY HH:MM AM/PM
+    r'\b(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{2,4}\s+\d{1,2}:\d{2}\s*(?:AM|PM)?)\b'  # DD Mon YYYY HH:MM AM/PM
+)]
+
+# Accepted date/time formats, ordered by how often they appear in scraped
+# data so the common case exits after one strptime attempt
+_DT_FORMATS = (
+    '%m/%d/%Y %I:%M %p',   # 01/25/2025 07:30 PM
+    '%Y-%m-%d %H:%M:%S',   # 2025-01-25 19:30:00
+    '%m/%d/%Y\n%I:%M %p',  # 01/25/2025\n07:30 PM
+    '%m/%d/%Y %H:%M',      # 01/25/2025 19:30
+    '%Y-%m-%d %I:%M %p',   # 2025-01-25 07:30 PM
+    '%m/%d/%y %I:%M %p',   # 01/25/25 07:30 PM
+    '%d/%m/%Y %H:%M',      # 25/01/2025 19:30
+    '%Y/%m/%d %H:%M',      # 2025/01/25 19:30
+)
+
+# Combined matcher for the two dominant shapes, with named groups so the
+# datetime can be built directly from the components: strptime rebuilds
+# its locale-aware format regex machinery per call, and for high-volume
+# parsing one regex pass plus a datetime() constructor skips all of it
+_DT_DIRECT_RE = re.compile(
+    r'^(?:(?P<m>\d{1,2})/(?P<d>\d{1,2})/(?P<Y>\d{4})[ \n](?P<I>\d{1,2}):(?P<M>\d{2}) (?P<ap>[AP]M)'
+    r'|(?P<iY>\d{4})-(?P<im>\d{2})-(?P<id>\d{2}) (?P<iH>\d{1,2}):(?P<iM>\d{2}):(?P<iS>\d{2}))$'
+)
+
+# Shape classifiers: one cheap regex pass narrows a string down to the
+# strptime format(s) that can possibly parse it, so the common case costs
+# one strptime call instead of a ladder of caught ValueErrors
+_DT_SHAPES = (
+    (re.compile(r'^\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2} [AP]M$'), ('%m/%d/%Y %I:%M %p',)),
+    (re.compile(r'^\d{1,2}/\d{1,2}/\d{4}\n\d{1,2}:\d{2} [AP]M$'), ('%m/%d/%Y\n%I:%M %p',)),
+    (re.compile(r'^\d{1,2}/\d{1,2}/\d{2} \d{1,2}:\d{2} [AP]M$'), ('%m/%d/%y %I:%M %p',)),
+    (re.compile(r'^\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2}$'), ('%m/%d/%Y %H:%M', '%d/%m/%Y %H:%M')),
+    (re.compile(r'^\d{4}-\d{2}-\d{2} \d{1,2}:\d{2}:\d{2}$'), ('%Y-%m-%d %H:%M:%S',)),
+    (re.compile(r'^\d{4}-\d{2}-\d{2} \d{1,2}:\d{2} [AP]M$'), ('%Y-%m-%d %I:%M %p',)),
+    (re.compile(r'^\d{4}/\d{1,2}/\d{1,2} \d{1,2}:\d{2}$'), ('%Y/%m/%d %H:%M',)),
+)
+
+@functools.lru_cache(maxsize=4096)
+def _parse_dt(value: str) -> str:
+    """Parse a date/time string into the canonical MM/DD/YYYY HH:MM AM/PM form
+
+    Memoized: the same timestamps recur across runs and across the
+    validate/sanitize passes, and strptime redoes its format-regex setup
+    on every call, so each distinct string is parsed at most once.
+
+    Raises:
+        ValueError: If the string matches none of the accepted formats
+    """
+    # Dominant shapes parse straight from the regex components; anything
+    # with an out-of-range component drops through to the strptime paths,
+    # which reject it the same way they always did
+    match = _DT_DIRECT_RE.match(value)
+    if match:
+        try:
+            if match.group('m'):
+                hour = int(match.group('I'))
+                if not 1 <= hour <= 12:
+                    raise ValueError(value)
+                if match.group('ap') == 'PM':
+                    hour = hour % 12 + 12
+                else:
+                    hour = hour % 12
+                dt = datetime(int(match.group('Y')), int(match.group('m')),
+                              int(match.group('d')), hour, int(match.group('M')))
+            else:
+                dt = datetime(int(match.group('iY')), int(match.group('im')),
+                              int(match.group('id')), int(match.group('iH')),
+                              int(match.group('iM')), int(match.group('iS')))
+            return dt.strftime('%m/%d/%Y %I:%M %p')
+        except ValueError:
+            pass
+
+    for shape, formats in _DT_SHAPES:
+        if shape.match(value):
+            for fmt in formats:
+                try:
+                    return datetime.strptime(value, fmt).strftime('%m/%d/%Y %I:%M %p')
+                except ValueError:
+                    continue
+            break
+    # Variants the classifiers don't model (e.g. lowercase am/pm, extra
+    # whitespace) still get the full format ladder
+    for fmt in _DT_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).strftime('%m/%d/%Y %I:%M %p')
+        except ValueError:
+            continue
+    raise ValueError("Invalid date format. Expected MM/DD/YYYY HH:MM AM/PM")
+
+# slots: error objects are created in bulk on bad batches, and skipping
+# the per-instance __dict__ makes them smaller and faster to allocate;
+# frozen because they are value objects that nothing mutates after creation
+@dataclass(slots=True, frozen=True)
 class AssignmentValidationError:
     field: str
     error: str
@@ -24,6 +149,14 @@ class AssignmentValidator:
         'info': str,
         'comments': str
     }
+
+    # Interned (field, type) pairs for the hot loops: a tuple avoids the
+    # per-iteration dict-item tuple allocation of .items(), and interned
+    # keys let dict lookups hit the pointer-equality fast path
+    _REQUIRED_FIELD_ITEMS = tuple(
+        (sys.intern(field), expected_type)
+        for field, expected_type in REQUIRED_FIELDS.items()
+    )
     
     # Known valid values for certain fields (case-insensitive)
     VALID_SERVICE_TYPES = {
@@ -43,38 +176,76 @@ class AssignmentValidator:
         'Spanish', 'French', 'Portuguese', 'Mandarin', 'Cantonese',
         'Vietnamese', 'Russian', 'Arabic', 'Korean', 'Japanese'
     }
+
+    # Constant error text built once at class scope; the listing tracks the
+    # canonical entries of VALID_SERVICE_TYPES
+    _UNKNOWN_SERVICE_TYPE_ERROR = (
+        "Unknown service type. Valid types: In-person Interpretation, "
+        "Video Interpretation, Phone Interpretation, Document Translation"
+    )
+
+    # (original, lowercase, length) rows precomputed once so the typo loop
+    # neither re-lowercases the fixed set per assignment nor runs the edit
+    # distance when the length gap alone already rules a match out; sorted
+    # for deterministic suggestion order
+    _COMMON_LANGUAGES_LOWER = tuple(
+        (language, language.lower(), len(language))
+        for language in sorted(COMMON_LANGUAGES)
+    )
     
     @classmethod
-    def validate_assignment(cls, assignment: Dict[str, str]) -> List[AssignmentValidationError]:
+    def validate_assignment(cls, assignment: Dict[str, str],
+                            presanitized: bool = False) -> List[AssignmentValidationError]:
         """
         Validate a single assignment dictionary
-        
+
         Args:
             assignment: Dictionary containing assignment data
-            
+            presanitized: True when the input already went through
+                sanitize_assignment (skips the redundant emptiness scan)
+
         Returns:
             List of validation errors, empty if valid
         """
+        errors = cls._required_field_errors(assignment)
+        errors.extend(cls._content_errors(assignment, presanitized=presanitized))
+        return errors
+
+    @classmethod
+    def _required_field_errors(cls, assignment: Dict[str, str]) -> List[AssignmentValidationError]:
+        """Check presence and type of the required fields for one assignment"""
         errors = []
-        
-        # Check required fields
-        for field, expected_type in cls.REQUIRED_FIELDS.items():
-            if field not in assignment:
+        for field, expected_type in cls._REQUIRED_FIELD_ITEMS:
+            value = assignment.get(field, _MISSING)
+            if value is _MISSING:
                 errors.append(AssignmentValidationError(
                     field=field,
                     error="Missing required field",
                     value="N/A"
                 ))
                 continue
-                
-            value = assignment[field]
+
             if not isinstance(value, expected_type):
                 errors.append(AssignmentValidationError(
                     field=field,
                     error=f"Invalid type. Expected {expected_type.__name__}, got {type(value).__name__}",
                     value=str(value)
                 ))
-        
+        return errors
+
+    @classmethod
+    def _content_errors(cls, assignment: Dict[str, str],
+                        presanitized: bool = False) -> List[AssignmentValidationError]:
+        """Run the per-field content checks (dates, service type, language, customer)
+
+        Args:
+            assignment: Assignment dictionary to check
+            presanitized: True when the input already went through
+                sanitize_assignment, which strips whitespace and turns
+                empty values into 'N/A', making the emptiness scan dead work
+        """
+        errors = []
+
         # Validate date_time format
         if 'date_time' in assignment:
             date_str = assignment['date_time']
@@ -84,11 +255,9 @@ class AssignmentValidator:
             for field in ['info', 'comments']:
                 if field in assignment:
                     # Look for common date/time patterns
-                    text = assignment[field]
-                    # Match patterns like MM/DD/YYYY HH:MM AM/PM or YYYY-MM-DD HH:MM
-                    date_matches = re.findall(r'(\d{1,2}/\d{1,2}/\d{2,4}\s+\d{1,2}:\d{2}\s*(?:AM|PM)?|\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})', text)
-                    if date_matches:
-                        date_str = date_matches[0]
+                    match = _EMBEDDED_DATE_RE.search(assignment[field])
+                    if match:
+                        date_str = match.group(1)
                         assignment['date_time'] = date_str
                         break
             
@@ -100,17 +269,8 @@ class AssignmentValidator:
                 ))
                 return errors
             try:
-                # Try multiple common date formats and standardize
-                for fmt in ['%m/%d/%Y %I:%M %p', '%Y-%m-%d %H:%M:%S', '%m/%d/%Y\n%I:%M %p']:
-                    try:
-                        dt = datetime.strptime(date_str, fmt)
-                        # Convert to standard format
-                        assignment['date_time'] = dt.strftime('%m/%d/%Y %I:%M %p')
-                        break
-                    except ValueError:
-                        continue
-                else:
-                    raise ValueError("Invalid date format. Expected MM/DD/YYYY HH:MM AM/PM")
+                # Parse and standardize via the memoized format cache
+                assignment['date_time'] = _parse_dt(date_str)
             except ValueError as e:
                 errors.append(AssignmentValidationError(
                     field='date_time',
@@ -135,28 +295,38 @@ class AssignmentValidator:
             if normalized_type not in cls.VALID_SERVICE_TYPES:
                 errors.append(AssignmentValidationError(
                     field='service_type',
-                    error=f"Unknown service type. Valid types: In-person Interpretation, Video Interpretation, Phone Interpretation, Document Translation",
+                    error=cls._UNKNOWN_SERVICE_TYPE_ERROR,
                     value=service_type
                 ))
             else:
                 # Update to normalized value
                 assignment['service_type'] = normalized_type
         
-        # Check for empty or whitespace-only values
-        for field, value in assignment.items():
-            if isinstance(value, str) and not value.strip():
-                errors.append(AssignmentValidationError(
-                    field=field,
-                    error="Empty or whitespace-only value",
-                    value=value
-                ))
+        # Check for empty or whitespace-only values (sanitized input
+        # cannot contain them, so skip the scan)
+        if not presanitized:
+            for field, value in assignment.items():
+                if isinstance(value, str) and not value.strip():
+                    errors.append(AssignmentValidationError(
+                        field=field,
+                        error="Empty or whitespace-only value",
+                        value=value
+                    ))
         
         # Validate language field for common typos
         if 'language' in assignment:
             language = assignment['language']
             if language not in cls.COMMON_LANGUAGES:
-                # Check for close matches to detect potential typos
-                close_matches = [l for l in cls.COMMON_LANGUAGES if cls._similar_strings(language, l)]
+                # Check for close matches to detect potential typos. A
+                # length gap above 2 already guarantees distance > 2, so
+                # those entries skip the edit-distance check entirely
+                lang_lower = language.lower()
+                lang_len = len(lang_lower)
+                close_matches = [
+                    original for original, lowered, length in cls._COMMON_LANGUAGES_LOWER
+                    if abs(length - lang_len) <= 2
+                    and cls._similar_strings_lower(lang_lower, lowered)
+                ]
                 if close_matches:
                     errors.append(AssignmentValidationError(
                         field='language',
@@ -177,71 +347,111 @@ class AssignmentValidator:
         return errors
     
     @classmethod
-    def validate_assignments(cls, assignments: List[Dict[str, str]]) -> Dict[int, List[AssignmentValidationError]]:
+    def validate_assignments(cls, assignments: List[Dict[str, str]],
+                             presanitized: bool = False) -> Dict[int, List[AssignmentValidationError]]:
         """
         Validate a list of assignments
-        
+
         Args:
             assignments: List of assignment dictionaries
-            
+            presanitized: True when the inputs already went through
+                sanitize_assignment (skips the redundant emptiness scan)
+
         Returns:
             Dictionary mapping assignment index to list of validation errors
         """
         validation_errors = {}
-        
+        if not assignments:
+            return validation_errors
+
+        # Structural checks run field-major: one pass over all rows per
+        # required field amortizes the per-field setup (name lookup,
+        # expected type) across the batch instead of redoing it per row
+        structural: Dict[int, List[AssignmentValidationError]] = {}
+        for field, expected_type in cls._REQUIRED_FIELD_ITEMS:
+            for i, assignment in enumerate(assignments):
+                value = assignment.get(field, _MISSING)
+                if value is _MISSING:
+                    structural.setdefault(i, []).append(AssignmentValidationError(
+                        field=field,
+                        error="Missing required field",
+                        value="N/A"
+                    ))
+                elif not isinstance(value, expected_type):
+                    structural.setdefault(i, []).append(AssignmentValidationError(
+                        field=field,
+                        error=f"Invalid type. Expected {expected_type.__name__}, got {type(value).__name__}",
+                        value=str(value)
+                    ))
+
+        # Collect all error lines and emit one warning record for the
+        # batch: each logger call pays formatting and handler dispatch, so
+        # per-error calls dominate runtime on bad batches
+        log_warnings = logger.isEnabledFor(logging.WARNING)
+        warning_lines = []
         for i, assignment in enumerate(assignments):
-            errors = cls.validate_assignment(assignment)
+            errors = structural.get(i, [])
+            errors.extend(cls._content_errors(assignment, presanitized=presanitized))
             if errors:
                 validation_errors[i] = errors
-                
-                # Log validation errors
-                logger.warning(f"Validation errors in assignment #{i + 1}:")
-                for error in errors:
-                    logger.warning(f"  - {error.field}: {error.error} (value: {error.value})")
-        
+                if log_warnings:
+                    warning_lines.append(f"Validation errors in assignment #{i + 1}:")
+                    warning_lines.extend(
+                        f"  - {error.field}: {error.error} (value: {error.value})"
+                        for error in errors
+                    )
+
+        if warning_lines:
+            logger.warning("\n".join(warning_lines))
+
         return validation_errors
     
-    @staticmethod
-    def _similar_strings(s1: str, s2: str) -> bool:
+    @classmethod
+    def _similar_strings(cls, s1: str, s2: str) -> bool:
         """Check if two strings are similar (for typo detection)"""
-        s1 = s1.lower()
-        s2 = s2.lower()
-        
+        return cls._similar_strings_lower(s1.lower(), s2.lower())
+
+    @staticmethod
+    def _similar_strings_lower(s1: str, s2: str) -> bool:
+        """Similarity check for strings already lowercased by the caller"""
         # Exact match
         if s1 == s2:
             return True
-            
-        # Levenshtein distance for similar strings
+
+        if _Levenshtein is not None:
+            return _Levenshtein.distance(s1, s2, score_cutoff=2) <= 2
+
+        # Pure-Python Levenshtein fallback with cutoff: DP row minima never
+        # decrease, so once a whole row exceeds the threshold no suffix can
+        # bring the distance back under it and the loop can stop early
         if len(s1) > len(s2):
             s1, s2 = s2, s1
-            
+        if len(s2) - len(s1) > 2:
+            return False
+
         distances = range(len(s1) + 1)
         for i2, c2 in enumerate(s2):
-            distances_ = [i2+1]
+            distances_ = [i2 + 1]
+            row_min = i2 + 1
             for i1, c1 in enumerate(s1):
                 if c1 == c2:
-                    distances_.append(distances[i1])
+                    d = distances[i1]
                 else:
-                    distances_.append(1 + min((distances[i1], distances[i1 + 1], distances_[-1])))
+                    d = 1 + min((distances[i1], distances[i1 + 1], distances_[-1]))
+                distances_.append(d)
+                if d < row_min:
+                    row_min = d
+            if row_min > 2:
+                return False
             distances = distances_
-            
+
         # Return True if the strings are similar enough (distance <= 2)
         return distances[-1] <= 2
     
     @staticmethod
     def _is_valid_customer_name(name: str) -> bool:
         """Validate customer name format"""
-        # Check for common invalid patterns
-        invalid_patterns = [
-            r'^\s*$',  # Empty or whitespace only
-            r'^[0-9]+$',  # Numbers only
-            r'^test.*$',  # Test entries
-            r'^unknown$',  # Unknown entries
-            r'^n/?a$',  # N/A entries
-        ]
-        
-        name = name.lower().strip()
-        return not any(re.match(pattern, name) for pattern in invalid_patterns)
+        return _INVALID_CUSTOMER_RE.match(name.lower().strip()) is None
 
 def extract_date_time(text: str) -> Optional[str]:
     """
@@ -253,136 +463,174 @@ def extract_date_time(text: str) -> Optional[str]:
     Returns:
         Extracted date/time string if found, None otherwise
     """
-    # Common date/time patterns
-    patterns = [
-        r'\b(\d{1,2}/\d{1,2}/\d{2,4}\s+\d{1,2}:\d{2}\s*(?:AM|PM)?)\b',  # MM/DD/YYYY HH:MM AM/PM
-        r'\b(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})\b',  # YYYY-MM-DD HH:MM
-        r'\b(\d{1,2}-\d{1,2}-\d{2,4}\s+\d{1,2}:\d{2}\s*(?:AM|PM)?)\b',  # MM-DD-YYYY HH:MM AM/PM
-        r'\b(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{2,4}\s+\d{1,2}:\d{2}\s*(?:AM|PM)?)\b'  # DD Mon YYYY HH:MM AM/PM
-    ]
-    
-    for pattern in patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        if matches:
-            return matches[0]
-    
+    # search() stops at the first hit and allocates no result list,
+    # unlike findall, which keeps scanning the whole text
+    for pattern in _DATETIME_RES:
+        match = pattern.search(text)
+        if match:
+            return match.group(1)
+
     return None
 
+# Core identifying fields that should always be lowercase
+_LOWERCASE_FIELDS = frozenset({'customer', 'service_type'})
+
+# Fields that should maintain their case
+_CASE_SENSITIVE_FIELDS = frozenset({'info', 'comments', 'language'})
+
+# Known empty value indicators (frozenset: O(1) membership, built once)
+_EMPTY_VALUES = frozenset({'n/a', 'none', 'null', '-', 'unknown', 'not specified', 'not available'})
+
+# Service-type variations mapped to standard values, built once instead of
+# per sanitized row; a tuple of pairs keeps the scan order explicit
+_SERVICE_TYPE_MAPPING = (
+    ('in person', 'in-person interpretation'),
+    ('in-person', 'in-person interpretation'),
+    ('video', 'video interpretation'),
+    ('phone', 'phone interpretation'),
+    ('document', 'document translation'),
+)
+
+# Prefix tuple for the startswith fast path in _sanitize_service_type
+_SERVICE_PREFIXES = tuple(pattern for pattern, _ in _SERVICE_TYPE_MAPPING)
+
+def _sanitize_lower(value: str, assignment: Dict[str, str]) -> str:
+    """Strip, normalize empties to N/A, lowercase (the default treatment)"""
+    value = value.strip()
+    if not value or value.lower() in _EMPTY_VALUES:
+        value = 'N/A'
+    return value.lower()
+
+def _sanitize_keep_case(value: str, assignment: Dict[str, str]) -> str:
+    """Strip and normalize empties, preserving case for free-text fields"""
+    value = value.strip()
+    if not value or value.lower() in _EMPTY_VALUES:
+        return 'N/A'
+    return value
+
+def _sanitize_service_type(value: str, assignment: Dict[str, str]) -> str:
+    """Lowercase, then map known variations to standard service types"""
+    value = _sanitize_lower(value, assignment)
+    # Scraped values lead with the keyword, so a single startswith against
+    # the prefix tuple (one C call) settles the common case before any
+    # per-pattern Python-level scanning
+    if value.startswith(_SERVICE_PREFIXES):
+        for pattern, standard in _SERVICE_TYPE_MAPPING:
+            if value.startswith(pattern):
+                return standard
+    # Rare: keyword appears mid-string (e.g. 'remote video'); keep the
+    # substring scan so those still normalize
+    return next(
+        (standard for pattern, standard in _SERVICE_TYPE_MAPPING if pattern in value),
+        value
+    )
+
+def _sanitize_date_time(value: str, assignment: Dict[str, str]) -> str:
+    """Normalize empties, falling back to extraction from info/comments"""
+    value = value.strip()
+    if not value or value.lower() in _EMPTY_VALUES:
+        value = 'N/A'
+        # If date_time is missing, try to extract from other fields
+        for field in ['info', 'comments']:
+            if field in assignment:
+                extracted = extract_date_time(assignment[field])
+                if extracted:
+                    value = extracted
+                    break
+
+        if value != 'N/A':
+            try:
+                value = _parse_dt(value)
+            except ValueError:
+                pass  # Unrecognized format: keep the raw value for review
+    return value.lower()
+
+# Fields excluded from the sanitized result (scraped table scaffolding)
+_EXCLUDED_FIELDS = frozenset({'header', 'timestamp'})
+
+# Per-field sanitizers: the schema is fixed, so each known field gets a
+# handler specialized for its rules and sanitize_assignment dispatches
+# once per key instead of re-testing every field-name branch on every key.
+# Handlers take (value, assignment); the full row is passed through so
+# date_time can fall back to extracting from sibling fields
+_FIELD_SANITIZERS = {
+    'customer': _sanitize_lower,
+    'service_type': _sanitize_service_type,
+    'date_time': _sanitize_date_time,
+    'language': _sanitize_keep_case,
+    'info': _sanitize_keep_case,
+    'comments': _sanitize_keep_case,
+}
+
 def sanitize_assignment(assignment: Dict[str, str]) -> Dict[str, str]:
     """
     Sanitize assignment data by cleaning and normalizing values
-    
+
     Args:
         assignment: Raw assignment dictionary
-        
+
     Returns:
         Sanitized assignment dictionary
     """
     sanitized = {}
-    
-    # Core identifying fields that should always be lowercase
-    lowercase_fields = {'customer', 'service_type'}
-    
-    # Fields that should maintain their case
-    case_sensitive_fields = {'info', 'comments', 'language'}
-    
-    # Known empty value indicators
-    empty_values = {'n/a', 'none', 'null', '-', 'unknown', 'not specified', 'not available'}
-    
+
     for key, value in assignment.items():
         if not isinstance(value, str):
             sanitized[key] = value
-            continue
-            
-        # Strip whitespace
-        value = value.strip()
-        
-        # Normalize empty values
-        if not value or value.lower() in empty_values:
-            value = 'N/A'
-            
-            # Handle date_time field
-            if key == 'date_time':
-                # If date_time is missing, try to extract from other fields
-                if not value or value.lower() in empty_values:
-                    for field in ['info', 'comments']:
-                        if field in assignment:
-                            extracted = extract_date_time(assignment[field])
-                            if extracted:
-                                value = extracted
-                                break
-                
-                if value and value.lower() not in empty_values:
-                    try:
-                        # Try multiple common date formats and standardize
-                        for fmt in [
-                            '%m/%d/%Y %I:%M %p',  # 01/25/2025 07:30 PM
-                            '%Y-%m-%d %H:%M:%S',   # 2025-01-25 19:30:00
-                            '%m/%d/%Y\n%I:%M %p',  # 01/25/2025\n07:30 PM
-                            '%m/%d/%Y %H:%M',      # 01/25/2025 19:30
-                            '%Y-%m-%d %I:%M %p',   # 2025-01-25 07:30 PM
-                            '%m/%d/%y %I:%M %p',   # 01/25/25 07:30 PM
-                            '%d/%m/%Y %H:%M',      # 25/01/2025 19:30
-                            '%Y/%m/%d %H:%M',      # 2025/01/25 19:30
-                        ]:
-                            try:
-                                dt = datetime.strptime(value, fmt)
-                                value = dt.strftime('%m/%d/%Y %I:%M %p')  # Standardize format
-                                break
-                            except ValueError:
-                                continue
-                    except Exception as e:
-                        logger.warning(f"Failed to normalize date format: {str(e)}")
-                        value = 'N/A'
-        
-        # Apply case normalization based on field type
-        if key in lowercase_fields:
-            value = value.lower()  # Always lowercase for core identifying fields
-        elif key not in case_sensitive_fields:
-            value = value.lower()  # Default to lowercase for other fields
-            
-        # Normalize service type
-        if key == 'service_type':
-            value = value.strip().lower()
-            # Map similar service types to standard values
-            service_type_mapping = {
-                'in person': 'in-person interpretation',
-                'in-person': 'in-person interpretation',
-                'video': 'video interpretation',
-                'phone': 'phone interpretation',
-                'document': 'document translation'
-            }
-            for pattern, standard in service_type_mapping.items():
-                if pattern in value:
-                    value = standard
-                    break
-                
-        # Keep language in original case to preserve proper nouns
-        if key == 'language':
-            value = value.strip()  # Just clean whitespace, preserve case
-            
-        # Exclude headers and timestamps from the sanitized result
-        if key not in {'header', 'timestamp'}:
-            sanitized[key] = value
-        
+        elif key not in _EXCLUDED_FIELDS:
+            # Unknown fields get the default lowercase treatment
+            sanitized[key] = _FIELD_SANITIZERS.get(key, _sanitize_lower)(value, assignment)
+
     return sanitized
 
+def iter_validate_and_sanitize(assignments):
+    """
+    Sanitize and validate assignments one at a time
+
+    Fuses the two passes so each assignment is sanitized, validated and
+    emitted before the next is touched: the raw row is still warm in cache
+    when validation reads it, and streaming callers never hold two full
+    copies of the batch at once.
+
+    Args:
+        assignments: Iterable of raw assignment dictionaries
+
+    Yields:
+        Tuples of (sanitized assignment, validation errors)
+    """
+    for assignment in assignments:
+        sanitized = sanitize_assignment(assignment)
+        yield sanitized, AssignmentValidator.validate_assignment(sanitized, presanitized=True)
+
 def validate_and_sanitize_assignments(assignments: List[Dict[str, str]]) -> tuple[List[Dict[str, str]], Dict[int, List[AssignmentValidationError]]]:
     """
     Validate and sanitize a list of assignments
-    
+
     Args:
         assignments: List of raw assignment dictionaries
-        
+
     Returns:
         Tuple of (sanitized assignments, validation errors)
     """
-    # First sanitize the assignments
-    sanitized_assignments = [sanitize_assignment(assignment) for assignment in assignments]
-    
-    # Then validate them
-    validation_errors = AssignmentValidator.validate_assignments(sanitized_assignments)
-    
+    sanitized_assignments = []
+    validation_errors = {}
+    log_warnings = logger.isEnabledFor(logging.WARNING)
+    warning_lines = []
+    for i, (sanitized, errors) in enumerate(iter_validate_and_sanitize(assignments)):
+        sanitized_assignments.append(sanitized)
+        if errors:
+            validation_errors[i] = errors
+            if log_warnings:
+                warning_lines.append(f"Validation errors in assignment #{i + 1}:")
+                warning_lines.extend(
+                    f"  - {error.field}: {error.error} (value: {error.value})"
+                    for error in errors
+                )
+
+    # One warning record for the whole batch instead of 1 + N per bad row
+    if warning_lines:
+        logger.warning("\n".join(warning_lines))
+
     # Log summary
     total_errors = sum(len(errors) for errors in validation_errors.values())
     if total_errors > 0: